@@ -17,26 +17,44 @@ Documents per day (as applicable):
   - ROE    (phase transitions + amendments)
 
 Usage:
-  pip install python-docx
+  pip install "python-docx>=1.1,<1.3"
   python ogg_generator.py                   # 8-day demo
   python ogg_generator.py --days 365        # full year
   python ogg_generator.py --days 100 --output ./my_output
+  python ogg_generator.py --days 365 --workers 4   # 4 worker processes
+  python ogg_generator.py --days 365 --bundle      # one Day_NNN.zip per day
+  python ogg_generator.py --compress-level 0       # store .docx parts uncompressed
 
-Requirements: python-docx (pip install python-docx)
+Requirements: python-docx >=1.1,<1.3 (save_docx uses its package-writer internals)
 =============================================================================
 """
 
+import copy
+import io
 import os
+import pkgutil
+import re
 import sys
 import random
 import argparse
+import bisect
+import functools
+import threading
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+from lxml import etree
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_ORIENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.opc.pkgwriter import PackageWriter
+from docx.text.paragraph import Paragraph
 
 # ============================================================================
 # CONFIGURATION
@@ -53,6 +71,20 @@ PHASES = {
 CCIR_INTERVAL = 3   # generate CCIR every N days
 PIR_INTERVAL = 3    # generate PIR every N days
 
+# Deflate level for saved .docx files (0 = store uncompressed). zipfile's
+# default of 6 costs far more CPU than it saves in size on bulk runs.
+DOCX_COMPRESSLEVEL = 1
+
+# Write buffer for daily bundle zips, so each stored member's header and
+# data reach the file in a few large writes
+BUNDLE_BUFFER_SIZE = 256 * 1024
+
+# Index of every document written, one path per line, relative to the output root
+MANIFEST_NAME = "manifest.txt"
+
+# Days handed to a pool worker at a time
+DAYS_PER_TASK = 8
+
 # Base date for D-Day
 BASE_DATE = datetime(2026, 1, 20, 6, 0, 0)  # 200600ZJAN26
 
@@ -160,11 +192,34 @@ EVENTS_POOL = [
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Phase number for every day covered by PHASES, indexed by day (days past the
+# last phase end fall through to Phase IV)
+_PHASE_BY_DAY = [4] * (max(info["end"] for info in PHASES.values()) + 1)
+for _phase_num, _info in PHASES.items():
+    for _d in range(_info["start"], _info["end"] + 1):
+        _PHASE_BY_DAY[_d] = _phase_num
+
+# First day of each phase
+_PHASE_TRANSITION_DAYS = frozenset(info["start"] for info in PHASES.values())
+
+# Phase-dependent BodyTemplate bindings, formatted once per phase
+_PHASE_BINDINGS = {
+    phase: {
+        "PHASE": f"{phase:03d}",
+        "PHASE_LABEL": info["label"],
+        "PHASE_NAME": info["name"],
+        "PHASE_NAME_UPPER": info["name"].upper(),
+    }
+    for phase, info in PHASES.items()
+}
+
+# Phase name as used in file names
+_PHASE_SLUG = {phase: info["name"].replace(" ", "_") for phase, info in PHASES.items()}
+
 def get_phase(day):
     """Return phase number for a given operational day."""
-    for phase_num, info in PHASES.items():
-        if info["start"] <= day <= info["end"]:
-            return phase_num
+    if 0 <= day < len(_PHASE_BY_DAY):
+        return _PHASE_BY_DAY[day]
     return 4
 
 def get_phase_info(day):
@@ -173,75 +228,443 @@ def get_phase_info(day):
 
 def is_phase_transition(day):
     """Check if this day is the start of a new phase."""
-    return any(info["start"] == day for info in PHASES.values())
-
+    return day in _PHASE_TRANSITION_DAYS
+
+# Events active on each day, in EVENTS_POOL order, indexed by day (no events
+# are active past the last trigger window)
+_EVENTS_BY_DAY = [[] for _ in range(max(e[1] for e in EVENTS_POOL) + 1)]
+for _event in EVENTS_POOL:
+    for _d in range(_event[0], _event[1] + 1):
+        _EVENTS_BY_DAY[_d].append(_event)
+
+# Target selection works on indices into TARGET_POOL; the full records are
+# only looked up for the targets that end up active. _TARGET_AVAIL is the
+# availability column, and _TARGETS_AVAILABLE holds, for each distinct
+# availability day, the indices available as of that day.
+_TARGET_AVAIL = tuple(t[5] for t in TARGET_POOL)
+_TARGET_AVAIL_DAYS = sorted(set(_TARGET_AVAIL))
+_TARGETS_AVAILABLE = [tuple(i for i, a in enumerate(_TARGET_AVAIL) if a <= d)
+                      for d in _TARGET_AVAIL_DAYS]
+
+def active_events(day):
+    """Return the EVENTS_POOL entries whose trigger window contains day."""
+    if 0 <= day < len(_EVENTS_BY_DAY):
+        return list(_EVENTS_BY_DAY[day])
+    return []
+
+def available_targets(day):
+    """Return indices of the TARGET_POOL entries available on or before day."""
+    i = bisect.bisect_right(_TARGET_AVAIL_DAYS, day)
+    return _TARGETS_AVAILABLE[i - 1] if i else ()
+
+# Neutralized target indices as of each day, extended on demand. Each day
+# only adds the newly neutralized targets to the previous day's set, so a
+# target stays neutralized once hit. The schedule has its own RNG and is
+# always built forward from day 0, so any process gets the same result for
+# a given day regardless of the order days are generated in.
+_NEUTRALIZED_RNG = random.Random(42)
+_NEUTRALIZED_BY_DAY = []
+
+def neutralized_targets(day):
+    """Return the frozenset of TARGET_POOL indices neutralized as of day."""
+    while len(_NEUTRALIZED_BY_DAY) <= day:
+        d = len(_NEUTRALIZED_BY_DAY)
+        neutralized = _NEUTRALIZED_BY_DAY[-1] if _NEUTRALIZED_BY_DAY else frozenset()
+        available = available_targets(d)
+        new_count = min(len(available) - 5, int(d * 0.03)) - len(neutralized)
+        if new_count > 0:
+            candidates = [i for i in available if i not in neutralized]
+            neutralized = neutralized.union(_NEUTRALIZED_RNG.sample(candidates, new_count))
+        _NEUTRALIZED_BY_DAY.append(neutralized)
+    return _NEUTRALIZED_BY_DAY[day]
+
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+           "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+@functools.lru_cache(maxsize=4096)
 def mil_dtg(dt):
-    """Format datetime as military DTG."""
-    return dt.strftime("%d%H%MZ%b%y").upper()
+    """Format datetime as military DTG (DDHHMMZMONYY)."""
+    return f"{dt.day:02d}{dt.hour:02d}{dt.minute:02d}Z{_MONTHS[dt.month-1]}{dt.year % 100:02d}"
 
 def day_date(day_offset):
     """Get the datetime for a given day offset from D-Day."""
     return BASE_DATE + timedelta(days=day_offset)
 
+# Shared lengths and colors, built once instead of per run or cell
+_PT8 = Pt(8)
+_PT12 = Pt(12)
+_pt = functools.lru_cache(maxsize=None)(Pt)
+_BLUE = "D9E2F3"
+_GREEN = "E2EFDA"
+_YELLOW = "FFF2CC"
+_RED = "FFC7CE"
+_RGB_RED = RGBColor(255, 0, 0)
+_RGB_GREEN = RGBColor(0, 128, 0)
+
+# python-docx's default template, read once; every document starts from it
+_BLANK = pkgutil.get_data("docx", "templates/default.docx")
+
+# Point sizes of table text; each gets a regular and a bold paragraph style
+_CELL_TEXT_SIZES = (7, 8, 9)
+
+def _cell_style_name(size, bold):
+    return f"Table Text {size}pt Bold" if bold else f"Table Text {size}pt"
+
+def ensure_styles(doc):
+    """Add the table-text paragraph styles to doc, skipping any it already has."""
+    styles = doc.styles
+    normal = styles["Normal"]
+    for size in _CELL_TEXT_SIZES:
+        for bold in (False, True):
+            name = _cell_style_name(size, bold)
+            if name in styles:
+                continue
+            style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            style.base_style = normal
+            style.font.size = _pt(size)
+            if bold:
+                style.font.bold = True
+
+def new_document():
+    """Return a new Document parsed from the in-memory default template.
+
+    Styles are frozen once this returns: save_docx writes styles.xml (and
+    the other _FROZEN_PARTS) from a cached copy, so add or change styles
+    here, never in a generator.
+    """
+    doc = Document(io.BytesIO(_BLANK))
+    ensure_styles(doc)
+    return doc
+
+# Per-thread reusable documents, one per document kind
+_SCRATCH = threading.local()
+
+def scratch_document(kind, landscape=False):
+    """Return this thread's document for `kind`: an empty body on narrow-margin
+    pages, landscape if asked.
+
+    Parsing the template package is most of the cost of a new document,
+    so each kind keeps one document and clears it for reuse. Styles and
+    header/footer parts stay attached, and the page setup comes from the
+    prebuilt section properties. The next call for the same kind resets
+    it again, so save it before then.
+    """
+    docs = getattr(_SCRATCH, "docs", None)
+    if docs is None:
+        docs = _SCRATCH.docs = {}
+    doc = docs.get(kind)
+    if doc is None:
+        doc = docs[kind] = new_document()
+    else:
+        body = doc.element.body
+        sectPr = body.sectPr
+        for child in list(body):
+            if child is not sectPr:
+                body.remove(child)
+    set_narrow_margins(doc, landscape)
+    return doc
+
+# Template w:shd element for each cell fill color; cells get deep copies
+_SHD = {color: parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}" w:val="clear"/>')
+        for color in (_BLUE, _GREEN, _YELLOW, _RED)}
+
 def set_cell_shading(cell, color):
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    shading.set(qn('w:val'), 'clear')
-    cell._tc.get_or_add_tcPr().append(shading)
+    """Fill cell with one of the _SHD colors."""
+    cell._tc.get_or_add_tcPr().append(copy.deepcopy(_SHD[color]))
+
+@functools.lru_cache(maxsize=None)
+def _cell_paragraph_props(size, bold):
+    """Return a template w:pPr applying a table-text style, built once."""
+    return new_document().add_paragraph(style=_cell_style_name(size, bold))._p.pPr
+
+def fill_cells(cells, values, size, bold=False):
+    """Set each cell's text in the table-text style for `size` points.
+
+    Pass a row's cells fetched once. Each cell's content is replaced by a
+    single paragraph built with its style reference in place, so the run
+    carries no formatting of its own and nothing is revisited.
+    """
+    ppr = _cell_paragraph_props(size, bold)
+    for cell, val in zip(cells, values):
+        tc = cell._tc
+        tc.clear_content()
+        p = tc.add_p()
+        p.append(copy.deepcopy(ppr))
+        p.add_r().text = val
+
+@functools.lru_cache(maxsize=None)
+def _header_paragraphs(headers, size):
+    """Return the bold w:p for each column header, built once."""
+    cells = new_document().add_table(rows=1, cols=len(headers)).rows[0].cells
+    fill_cells(cells, headers, size, bold=True)
+    return [cell._tc.p_lst[0] for cell in cells]
+
+def add_header_table(doc, headers, size, shading):
+    """Add a grid table whose first row holds bold, shaded column headers.
+
+    The header paragraphs are built once per header set and copied into
+    the row's w:tc elements, which python-docx has already sized.
+    """
+    table = doc.add_table(rows=1, cols=len(headers))
+    table.style = 'Table Grid'
+    for cell, p in zip(table.rows[0].cells, _header_paragraphs(tuple(headers), size)):
+        cell._tc.replace(cell._tc.p_lst[0], copy.deepcopy(p))
+        set_cell_shading(cell, shading)
+    return table
 
-def add_classification_header_footer(doc, text="UNCLASSIFIED"):
+def set_landscape(doc):
+    for section in doc.sections:
+        section.orientation = WD_ORIENT.LANDSCAPE
+        w, h = section.page_height, section.page_width
+        section.page_width = w
+        section.page_height = h
+
+def _style_classification(doc, text):
     for section in doc.sections:
         hp = section.header.paragraphs[0] if section.header.paragraphs else section.header.add_paragraph()
         hp.text = text
         hp.alignment = WD_ALIGN_PARAGRAPH.CENTER
         for run in hp.runs:
-            run.font.size = Pt(12)
+            run.font.size = _PT12
             run.font.bold = True
-            run.font.color.rgb = RGBColor(0, 128, 0)
+            run.font.color.rgb = _RGB_GREEN
         fp = section.footer.paragraphs[0] if section.footer.paragraphs else section.footer.add_paragraph()
         fp.text = text
         fp.alignment = WD_ALIGN_PARAGRAPH.CENTER
         for run in fp.runs:
-            run.font.size = Pt(12)
+            run.font.size = _PT12
             run.font.bold = True
-            run.font.color.rgb = RGBColor(0, 128, 0)
+            run.font.color.rgb = _RGB_GREEN
+
+@functools.lru_cache(maxsize=None)
+def _classification_paragraphs(text):
+    """Return the (header, footer) paragraph elements for a marking, built once."""
+    doc = new_document()
+    _style_classification(doc, text)
+    section = doc.sections[0]
+    return section.header.paragraphs[0]._p, section.footer.paragraphs[0]._p
 
-def set_narrow_margins(doc):
+def add_classification_header_footer(doc, text="UNCLASSIFIED"):
+    """Mark every section's header and footer with the classification.
+
+    The marking paragraphs are styled once and copied in, replacing the
+    first paragraph of each header/footer.
+    """
+    header_p, footer_p = _classification_paragraphs(text)
+    for section in doc.sections:
+        for part, marking in ((section.header, header_p), (section.footer, footer_p)):
+            root = part._element
+            first = root.find(qn('w:p'))
+            if first is not None:
+                root.replace(first, copy.deepcopy(marking))
+            else:
+                root.append(copy.deepcopy(marking))
+
+def _set_margins(section):
+    section.top_margin = Inches(1.0)
+    section.bottom_margin = Inches(1.0)
+    section.left_margin = Inches(1.0)
+    section.right_margin = Inches(1.0)
+
+@functools.lru_cache(maxsize=None)
+def _narrow_section_properties(landscape):
+    """Return the w:sectPr for 1-inch margins, optionally landscape, built once."""
+    doc = new_document()
+    _set_margins(doc.sections[0])
+    if landscape:
+        set_landscape(doc)
+    return doc.sections[0]._sectPr
+
+def set_narrow_margins(doc, landscape=False):
+    """Give every section 1-inch margins, and landscape pages if asked.
+
+    Each section's properties are replaced with a copy of a prebuilt
+    w:sectPr, keeping any header/footer references it already has.
+    """
+    template = _narrow_section_properties(landscape)
     for section in doc.sections:
-        section.top_margin = Inches(1.0)
-        section.bottom_margin = Inches(1.0)
-        section.left_margin = Inches(1.0)
-        section.right_margin = Inches(1.0)
+        sectPr = section._sectPr
+        replacement = copy.deepcopy(template)
+        replacement[0:0] = sectPr.xpath('w:headerReference|w:footerReference')
+        sectPr.getparent().replace(sectPr, replacement)
+
+def append_to_body(doc, elements):
+    """Insert block-level elements at the end of the body, ahead of its sectPr."""
+    body = doc.element.body
+    last = body[-1] if len(body) else None
+    if last is not None and last.tag == qn('w:sectPr'):
+        for el in elements:
+            last.addprevious(el)
+    else:
+        body.extend(elements)
+
+def new_paragraph(doc):
+    """Append an empty paragraph to the end of the document body.
+
+    Same result as doc.add_paragraph(), but inserts directly ahead of the
+    trailing body sectPr instead of searching the whole body for it, which
+    keeps paragraph creation constant-time as documents grow.
+    """
+    p = OxmlElement('w:p')
+    append_to_body(doc, [p])
+    return Paragraph(p, doc._body)
 
 def add_heading_block(doc, lines, size=11):
+    size = _pt(size)
     for line in lines:
-        p = doc.add_paragraph()
+        p = new_paragraph(doc)
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run(line)
         run.bold = True
-        run.font.size = Pt(size)
+        run.font.size = size
 
 def add_para(doc, text, bold=False, size=12, indent=0, space_after=6):
-    p = doc.add_paragraph()
-    p.paragraph_format.space_after = Pt(space_after)
+    p = new_paragraph(doc)
+    fmt = p.paragraph_format
+    fmt.space_after = _pt(space_after)
     if indent:
-        p.paragraph_format.left_indent = Inches(indent * 0.5)
+        fmt.left_indent = Inches(indent * 0.5)
     run = p.add_run(text)
     run.bold = bold
-    run.font.size = Pt(size)
+    run.font.size = _pt(size)
     return p
 
-def jitter_mgrs(base_mgrs):
-    """Add small random variation to an MGRS coordinate string."""
-    parts = base_mgrs.split()
+def add_multiline_para(doc, lines, bold=False, size=12, indent=0, space_after=6):
+    """Add one paragraph holding `lines` separated by line breaks."""
+    return add_para(doc, "\n".join(lines), bold=bold, size=size, indent=indent, space_after=space_after)
+
+@functools.lru_cache(maxsize=None)
+def _para_markup(bold, size, indent, space_after):
+    """Return (body_open, para_head, para_tail, body_close) for add_para's XML.
+
+    The paragraph is laid out once through add_para around a placeholder,
+    so bulk paragraphs serialize exactly as add_para would build them.
+    """
+    doc = new_document()
+    add_para(doc, "{{TEXT}}", bold=bold, size=size, indent=indent, space_after=space_after)
+    body = doc.element.body
+    body.remove(body[-1])
+    head, tail = etree.tostring(body, encoding="unicode").split("{{TEXT}}")
+    open_end = head.index(">") + 1
+    close_start = tail.rindex("</")
+    return head[:open_end], head[open_end:], tail[:close_start], tail[close_start:]
+
+def add_paras(doc, texts, bold=False, size=12, indent=0, space_after=6):
+    """Append one add_para-style paragraph per text with a single XML parse."""
+    texts = list(texts)
+    if not all(t and t == t.strip() and "\t" not in t and "\n" not in t for t in texts):
+        # Empty, padded or multi-line text needs python-docx's run handling
+        for t in texts:
+            add_para(doc, t, bold=bold, size=size, indent=indent, space_after=space_after)
+        return
+    body_open, head, tail, body_close = _para_markup(bold, size, indent, space_after)
+    xml = body_open + "".join(head + escape(t) + tail for t in texts) + body_close
+    append_to_body(doc, list(parse_xml(xml)))
+
+_JITTER_RANGE = range(-50, 51)
+
+def jitter_offsets(count, rng=random):
+    """Draw `count` (easting, northing) MGRS jitter offsets in one RNG call."""
+    draws = rng.choices(_JITTER_RANGE, k=2 * count)
+    return list(zip(draws[::2], draws[1::2]))
+
+def _parse_mgrs(mgrs):
+    """Split an MGRS string into (zone, square, easting, northing), or None."""
+    parts = mgrs.split()
     if len(parts) >= 4:
         try:
-            e = int(parts[2]) + random.randint(-50, 50)
-            n = int(parts[3]) + random.randint(-50, 50)
-            return f"{parts[0]} {parts[1]} {e:04d} {n:02d}"
-        except (ValueError, IndexError):
+            return parts[0], parts[1], int(parts[2]), int(parts[3])
+        except ValueError:
             pass
-    return base_mgrs
+    return None
+
+# Every target's base MGRS, parsed once
+_TARGET_MGRS = {t[3]: _parse_mgrs(t[3]) for t in TARGET_POOL}
+
+def jitter_mgrs(base_mgrs, offset=None):
+    """Add small random variation to an MGRS coordinate string.
+
+    `offset` is an (easting, northing) pair from jitter_offsets(); one is
+    drawn here if it is not supplied.
+    """
+    parts = _TARGET_MGRS.get(base_mgrs) or _parse_mgrs(base_mgrs)
+    if parts is None:
+        return base_mgrs
+    zone, square, e, n = parts
+    de, dn = offset if offset is not None else jitter_offsets(1)[0]
+    return f"{zone} {square} {e + de:04d} {n + dn:02d}"
+
+
+_SLOT_RE = re.compile(r"\{\{(\w+)\}\}")
+
+class BodyTemplate:
+    """A run of body content laid out once and re-rendered with bindings.
+
+    `build` is called once with a scratch Document and lays out paragraphs
+    with the usual helpers, writing {{SLOT}} placeholders wherever per-day
+    text belongs. The body XML is kept as alternating fixed segments and
+    slot names, so rendering is a string join and a single parse instead of
+    rebuilding every paragraph through python-docx.
+    """
+
+    def __init__(self, build):
+        doc = new_document()
+        build(doc)
+        body = doc.element.body
+        body.remove(body[-1])  # trailing sectPr belongs to the target doc
+        self._parts = _SLOT_RE.split(etree.tostring(body, encoding="unicode"))
+
+    def render(self, doc, bindings):
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = escape(bindings[parts[i]])
+        append_to_body(doc, list(parse_xml("".join(parts))))
+
+def slot_values(count):
+    """Return the {{0}}..{{count-1}} placeholders for a TableTemplate sample row."""
+    return [f"{{{{{i}}}}}" for i in range(count)]
+
+class TableTemplate:
+    """A table laid out once and re-rendered from rows of cell text.
+
+    `build` is called once with a scratch Document, sets up the page the
+    same way as the target document (column widths follow the page), and
+    lays out a single table: its fixed header row followed by one sample
+    row per row kind, with slot_values() placeholders where cell text goes.
+    Fixed paragraphs laid out before the table, such as its heading, are
+    rendered with it.
+    Rendering joins the pre-serialized rows and parses the table once,
+    instead of adding and formatting every row through python-docx.
+    """
+
+    def __init__(self, build):
+        doc = new_document()
+        build(doc)
+        body = doc.element.body
+        body.remove(body[-1])  # trailing sectPr belongs to the target doc
+        xml = etree.tostring(body, encoding="unicode")
+        first = xml.index("<w:tr")
+        rows_end = xml.rindex("</w:tr>") + len("</w:tr>")
+        rows = [r + "</w:tr>" for r in xml[first:rows_end].split("</w:tr>")[:-1]]
+        self._head = xml[:first] + rows[0]
+        self._rows = [_SLOT_RE.split(r) for r in rows[1:]]
+        self._tail = xml[rows_end:]
+
+    def render(self, doc, rows):
+        """Append the table with one row per (kind, values) pair in `rows`.
+
+        `kind` indexes the sample rows after the header; `values` fill its
+        placeholders and must be plain single-line text.
+        """
+        parts = [self._head]
+        for kind, values in rows:
+            segments = self._rows[kind]
+            parts.append(segments[0])
+            for i in range(1, len(segments), 2):
+                parts.append(escape(values[int(segments[i])]))
+                parts.append(segments[i + 1])
+        parts.append(self._tail)
+        append_to_body(doc, list(parse_xml("".join(parts))))
 
 
 # ============================================================================
@@ -251,11 +674,22 @@ def jitter_mgrs(base_mgrs):
 class DailyState:
     """Tracks the evolving operational state for a given day."""
 
+    __slots__ = (
+        "day", "day_str", "date", "dtg", "eff_dtg", "end_dtg", "phase", "phase_info",
+        "phase_label", "phase_name", "rng", "slm_strength", "hnsf_readiness",
+        "corridor_threat", "popular_support_gos", "tip_line_calls",
+        "amnesty_surrenders", "tip_line_24hr", "events", "event_texts", "active_targets",
+        "jiptl_above_cut", "jiptl_below_cut", "ato_missions", "acm_count",
+        "fscm_count", "bindings",
+    )
+
     def __init__(self, day):
         self.day = day
+        self.day_str = f"{day+1:03d}"
+        self.rng = random.Random(42 + day)  # deterministic per day
         self.date = day_date(day)
         self.dtg = mil_dtg(self.date)
-        self.eff_dtg = mil_dtg(self.date)
+        self.eff_dtg = self.dtg
         self.end_dtg = mil_dtg(self.date + timedelta(hours=18))
         self.phase = get_phase(day)
         self.phase_info = get_phase_info(day)
@@ -263,33 +697,28 @@ class DailyState:
         self.phase_name = self.phase_info["name"]
 
         # Evolving metrics
-        self.slm_strength = max(500, 3000 - int(day * 6.5) + random.randint(-100, 100))
-        self.hnsf_readiness = min(95, 35 + int(day * 0.18) + random.randint(-5, 5))
-        self.corridor_threat = max(1, 10 - int(day * 0.02) + random.randint(-1, 1))  # 1-10
-        self.popular_support_gos = min(80, 30 + int(day * 0.14) + random.randint(-3, 3))
-        self.tip_line_calls = max(0, int(day * 0.8) + random.randint(-5, 10))
-        self.amnesty_surrenders = max(0, int(day * 0.15) + random.randint(-2, 3))
+        self.slm_strength = max(500, 3000 - int(day * 6.5) + self.rng.randint(-100, 100))
+        self.hnsf_readiness = min(95, 35 + int(day * 0.18) + self.rng.randint(-5, 5))
+        self.corridor_threat = max(1, 10 - int(day * 0.02) + self.rng.randint(-1, 1))  # 1-10
+        self.popular_support_gos = min(80, 30 + int(day * 0.14) + self.rng.randint(-3, 3))
+        self.tip_line_calls = max(0, int(day * 0.8) + self.rng.randint(-5, 10))
+        self.amnesty_surrenders = max(0, int(day * 0.15) + self.rng.randint(-2, 3))
 
         # Select today's events
-        self.events = [e for e in EVENTS_POOL if e[0] <= day <= e[1]]
+        self.events = active_events(day)
         if self.events:
-            self.events = random.sample(self.events, min(len(self.events), random.randint(1, 3)))
+            self.events = self.rng.sample(self.events, min(len(self.events), self.rng.randint(1, 3)))
         self.event_texts = [e[2] for e in self.events]
 
         # Select today's active targets
-        available = [t for t in TARGET_POOL if t[5] <= day]
+        available = available_targets(day)
         # Some targets get "neutralized" over time
-        neutralized_count = min(len(available) - 5, int(day * 0.03))
-        random.seed(42 + day)  # deterministic per day
-        if neutralized_count > 0:
-            neutralized_ids = set(t[0] for t in random.sample(available, neutralized_count))
-        else:
-            neutralized_ids = set()
-        self.active_targets = [t for t in available if t[0] not in neutralized_ids]
-        random.shuffle(self.active_targets)
+        neutralized = neutralized_targets(day)
+        self.active_targets = [TARGET_POOL[i] for i in available if i not in neutralized]
+        self.rng.shuffle(self.active_targets)
 
         # JIPTL: prioritize top 8-12, rest below cut line
-        n_above_cut = min(len(self.active_targets), random.randint(6, 10))
+        n_above_cut = min(len(self.active_targets), self.rng.randint(6, 10))
         self.jiptl_above_cut = self.active_targets[:n_above_cut]
         self.jiptl_below_cut = self.active_targets[n_above_cut:]
 
@@ -297,23 +726,45 @@ class DailyState:
         self.ato_missions = self._generate_ato_missions()
 
         # ACM variations
-        self.acm_count = random.randint(6, 10)
-        self.fscm_count = random.randint(5, 8)
-
-        # Reset seed
-        random.seed(42)
+        self.acm_count = self.rng.randint(6, 10)
+        self.fscm_count = self.rng.randint(5, 8)
+
+        # FRAGO tip-line count for the last 24 hours, jittered around the trend
+        self.tip_line_24hr = max(0, self.tip_line_calls + self.rng.randint(-3, 3))
+
+        # Flat string bindings for BodyTemplate slots
+        self.bindings = {
+            "DAY": self.day_str,
+            "DTG": self.dtg,
+            "EFF_DTG": self.eff_dtg,
+            "END_DTG": self.end_dtg,
+            **_PHASE_BINDINGS[self.phase],
+            "SLM_STRENGTH": str(self.slm_strength),
+            "HNSF_READINESS": str(self.hnsf_readiness),
+            "CORRIDOR_THREAT": str(self.corridor_threat),
+            "GOS_SUPPORT": str(self.popular_support_gos),
+            "TIP_LINE_CALLS": str(self.tip_line_calls),
+            "AMNESTY_SURRENDERS": str(self.amnesty_surrenders),
+            "TIP_LINE_24HR": str(self.tip_line_24hr),
+        }
 
     def _generate_ato_missions(self):
         missions = []
         msn_num = 1
 
         # ISR missions covering JIPTL priority targets
-        isr_areas_today = random.sample(ISR_AREAS, min(len(ISR_AREAS), random.randint(4, 7)))
+        # Partial Fisher-Yates: only the first k slots of the copy are shuffled
+        areas = list(ISR_AREAS)
+        k = min(len(areas), self.rng.randint(4, 7))
+        for i in range(k):
+            j = self.rng.randint(i, len(areas) - 1)
+            areas[i], areas[j] = areas[j], areas[i]
+        isr_areas_today = areas[:k]
         for area in isr_areas_today:
-            platform = random.choice(MISSION_TYPES_ISR)
-            callsign = f"{platform[0]} {random.randint(1, 99):02d}"
-            start_hr = random.randint(6, 10)
-            end_hr = start_hr + random.randint(4, 12)
+            platform = self.rng.choice(MISSION_TYPES_ISR)
+            callsign = f"{platform[0]} {self.rng.randint(1, 99):02d}"
+            start_hr = self.rng.randint(6, 10)
+            end_hr = start_hr + self.rng.randint(4, 12)
             start_t = self.date + timedelta(hours=start_hr)
             end_t = self.date + timedelta(hours=min(end_hr, 23))
             missions.append({
@@ -324,13 +775,13 @@ class DailyState:
                 "msn_type": platform[3],
                 "target_area": area,
                 "tot": f"{mil_dtg(start_t)}-{mil_dtg(end_t)}",
-                "remarks": f"ISR coverage; ATO Day {self.day+1:03d}",
+                "remarks": f"ISR coverage; ATO Day {self.day_str}",
             })
             msn_num += 1
 
         # Support missions (MEDEVAC, airlift always present)
         for sup in MISSION_TYPES_SUPPORT[:2]:  # DUSTOFF + ATLAS always
-            callsign = f"{sup[0]} {random.randint(1, 20):02d}"
+            callsign = f"{sup[0]} {self.rng.randint(1, 20):02d}"
             missions.append({
                 "msn_num": f"ATO-{msn_num:03d}",
                 "callsign": callsign,
@@ -338,7 +789,7 @@ class DailyState:
                 "unit": sup[2],
                 "msn_type": sup[3],
                 "target_area": "CAMP CITRUS / JOA-WIDE",
-                "tot": f"{mil_dtg(self.date)}-{self.end_dtg}",
+                "tot": f"{self.dtg}-{self.end_dtg}",
                 "remarks": "Standing mission" if sup[3] == "MEDEVAC" else "Resupply run",
             })
             msn_num += 1
@@ -346,16 +797,16 @@ class DailyState:
         # Phase-dependent extra missions
         if self.phase >= 3:
             # More assault support in later phases
-            extra = random.choice(MISSION_TYPES_SUPPORT[2:])
-            callsign = f"{extra[0]} {random.randint(1, 20):02d}"
+            extra = self.rng.choice(MISSION_TYPES_SUPPORT[2:])
+            callsign = f"{extra[0]} {self.rng.randint(1, 20):02d}"
             missions.append({
                 "msn_num": f"ATO-{msn_num:03d}",
                 "callsign": callsign,
                 "acft": extra[1],
                 "unit": extra[2],
                 "msn_type": extra[3],
-                "target_area": random.choice(ISR_AREAS[:3]),
-                "tot": f"{mil_dtg(self.date + timedelta(hours=random.randint(1,6)))}",
+                "target_area": self.rng.choice(ISR_AREAS[:3]),
+                "tot": f"{mil_dtg(self.date + timedelta(hours=self.rng.randint(1,6)))}",
                 "remarks": "HNSF-led operation support",
             })
             msn_num += 1
@@ -363,43 +814,49 @@ class DailyState:
         return missions
 
 
+@functools.lru_cache(maxsize=None)
+def daily_state(day):
+    """Return the DailyState for a given day, building it only once per run."""
+    return DailyState(day)
+
+
 # ============================================================================
 # DOCUMENT GENERATORS
 # ============================================================================
 
 # ------- OPORD (Phase transitions only) -------
 
-def generate_opord(state, output_dir):
-    doc = Document()
-    set_narrow_margins(doc)
-    phase = state.phase
-    phase_name = state.phase_name
-
+_OPORD_REFS = (
+    "a. Map, Series Z901, Republic of Solara, Sheets 1-4, Edition 3, 1:250,000.",
+    "b. USSOCOM OPORD 25-007 (OPERATION SOUTHERN RESOLVE), DTG 150800ZDEC25.",
+    "c. U.S. Embassy Solara Country Team Assessment, 01 Dec 2025.",
+    "d. FM 5-0, Planning and Orders Production.",
+    "e. JP 3-22, Foreign Internal Defense.",
+    "f. JP 3-24, Counterinsurgency.",
+)
+
+_OPORD_ANNEXES = ("A-Task Organization","B-Intelligence","C-Operations","D-Fires","E-Protection",
+                  "F-Sustainment","G-Engineer","H-Signal","I-Air/Missile Defense","J-Public Affairs",
+                  "K-Civil Affairs","L-Information Collection","M-Assessment","N-Space Ops",
+                  "O-Omitted","P-Host-Nation Support","Q-KM","R-Reports","S-STO","T-Omitted",
+                  "U-IG","V-Interagency","W-OCS","X-Omitted","Y-Omitted","Z-Distribution")
+
+def _opord_opening(doc, refs):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         f"Copy 1 of 15 Copies",
         "JOINT TASK FORCE - GROVE GUARDIAN",
         "Camp Citrus, Arcadia, Republic of Solara",
-        state.dtg,
+        "{{DTG}}",
         "",
-        f"OPORD {phase:03d}-26 (OPERATION GROVE GUARDIAN - PHASE {state.phase_label}: {phase_name.upper()}) (UNCLASSIFIED)",
+        "OPORD {{PHASE}}-26 (OPERATION GROVE GUARDIAN - PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}}) (UNCLASSIFIED)",
     ])
 
     add_para(doc, "References:", bold=True)
-    refs = [
-        "a. Map, Series Z901, Republic of Solara, Sheets 1-4, Edition 3, 1:250,000.",
-        "b. USSOCOM OPORD 25-007 (OPERATION SOUTHERN RESOLVE), DTG 150800ZDEC25.",
-        "c. U.S. Embassy Solara Country Team Assessment, 01 Dec 2025.",
-        "d. FM 5-0, Planning and Orders Production.",
-        "e. JP 3-22, Foreign Internal Defense.",
-        "f. JP 3-24, Counterinsurgency.",
-    ]
-    if phase > 1:
-        refs.append(f"g. JTF-GG OPORD {phase-1:03d}-26 (Previous Phase).")
-    for r in refs:
-        add_para(doc, r, indent=1, space_after=2)
+    add_multiline_para(doc, refs, indent=1, space_after=2)
 
+def _opord_body(doc):
     add_para(doc, f"Time Zone: ZULU (Z)", bold=True)
     add_para(doc, "Task Organization: See Annex A (Task Organization).", bold=True)
 
@@ -410,95 +867,42 @@ def generate_opord(state, output_dir):
 
     doc.add_heading("b. Assigned Area", level=2)
     add_para(doc, f"(1) Terrain. Republic of Solara: landlocked nation dominated by swampy watershed, pine scrub, cattle ranches, and citrus groves. Key terrain: Port Manatee corridor, capital Arcadia, citrus processing facilities, SLM swamp sanctuaries. Refer to Annex B.")
-    add_para(doc, f"(2) Weather. {'Dry season; optimal conditions for ground ops and ISR.' if state.day < 150 else 'Wet season approaching; degraded ground mobility in swamp regions anticipated.'} Refer to Annex B.")
+    add_para(doc, "(2) Weather. {{WEATHER}} Refer to Annex B.")
 
     doc.add_heading("c. Enemy Forces", level=2)
-    add_para(doc, f"(1) The SLM is an irregular force currently estimated at {state.slm_strength} fighters in 15-20 cells. Recruited from Grove Laborers; sheltered by Scrub Folk. Funded by neighboring adversary.")
-    if phase == 1:
-        add_para(doc, "(2) SLM maintains initiative along the corridor with frequent sabotage. Swamp sanctuaries are largely uncontested. External support flowing freely across the border.")
-    elif phase == 2:
-        add_para(doc, "(2) SLM corridor attacks continuing but HNSF response improving. ISR providing increased early warning. SLM adapting tactics, shifting to nighttime operations. Border interdiction beginning to constrain supply.")
-    elif phase == 3:
-        add_para(doc, "(2) SLM under pressure across all operating areas. Corridor attacks reduced. Swamp sanctuaries being contested. Amnesty program generating defections. SLM leadership showing signs of internal friction.")
-    else:
-        add_para(doc, "(2) SLM significantly degraded. Remnants operating in small, isolated cells. Leadership fragmented. External support severely disrupted. SLM propaganda losing effectiveness.")
+    add_para(doc, "(1) The SLM is an irregular force currently estimated at {{SLM_STRENGTH}} fighters in 15-20 cells. Recruited from Grove Laborers; sheltered by Scrub Folk. Funded by neighboring adversary.")
+    add_para(doc, "(2) {{ENEMY_ASSESSMENT}}")
 
     doc.add_heading("d. Friendly Forces", level=2)
     add_para(doc, f"(1) Higher HQ Two Levels Up. USSOCOM.")
     add_para(doc, f"(2) Higher HQ One Level Up. USSOUTHCOM/TSOC.")
-    add_para(doc, f"(3) HNSF readiness assessed at {state.hnsf_readiness}%. GoS popular support at approximately {state.popular_support_gos}%.")
+    add_para(doc, "(3) HNSF readiness assessed at {{HNSF_READINESS}}%. GoS popular support at approximately {{GOS_SUPPORT}}%.")
 
     doc.add_heading("e. Civil Considerations", level=2)
-    add_para(doc, "Population divided into Orchard Barons, Grove Laborers (center of gravity), and Scrub Folk. " +
-             (f"Tip-line calls averaging {state.tip_line_calls}/day. {state.amnesty_surrenders} total amnesty surrenders to date." if state.day > 0 else "Initial engagement underway."))
+    add_para(doc, "Population divided into Orchard Barons, Grove Laborers (center of gravity), and Scrub Folk. {{CIVIL_STATUS}}")
 
     doc.add_heading("g. Assumptions", level=2)
     add_para(doc, "(1) GoS maintains political will. (2) HNSF remains loyal. (3) Neighboring adversary continues covert (not overt) support. (4) Port Manatee corridor remains sole economic export route.")
 
     # Para 2 - Mission
     doc.add_heading("2. MISSION", level=1)
-    mission_verbs = {
-        1: "establishes the JTF, conducts initial assessments, and begins advisory operations",
-        2: "conducts intensive HNSF training and establishes corridor security",
-        3: "conducts HNSF-led clearing operations and expands security",
-        4: "transitions security lead to HNSF and prepares for redeployment",
-    }
-    add_para(doc, f"Effective {state.eff_dtg}, JTF-GROVE GUARDIAN {mission_verbs[phase]} by, with, and through Host Nation Security Forces in the Republic of Solara in order to neutralize the SLM, secure the Port Manatee economic corridor, and address root socio-economic grievances, setting conditions for a stable Republic of Solara.", bold=True)
+    add_para(doc, "Effective {{EFF_DTG}}, JTF-GROVE GUARDIAN {{MISSION_VERB}} by, with, and through Host Nation Security Forces in the Republic of Solara in order to neutralize the SLM, secure the Port Manatee economic corridor, and address root socio-economic grievances, setting conditions for a stable Republic of Solara.", bold=True)
 
     # Para 3 - Execution
     doc.add_heading("3. EXECUTION", level=1)
     doc.add_heading("a. Commander's Intent", level=2)
-    intents = {
-        1: "Establish advisory relationships and ISR architecture to set conditions for decisive operations in subsequent phases.",
-        2: "Build HNSF capacity to independently secure the corridor while degrading SLM freedom of movement.",
-        3: "Press the advantage. HNSF-led operations deny SLM sanctuary while MISO and CA efforts accelerate population support for the GoS.",
-        4: "Ensure HNSF sustainability. Complete transition of all operations. Residual SOF capability for CT only.",
-    }
-    add_para(doc, f"Purpose: {intents[phase]}")
-
-    main_efforts = {1: "LOE 1 (Develop HNSF)", 2: "LOE 2 (Secure Corridor)", 3: "LOE 3 (Counter SLM)", 4: "LOE 1 (Sustain HNSF)"}
-    add_para(doc, f"Main Effort: {main_efforts[phase]}")
+    add_para(doc, "Purpose: {{INTENT}}")
+    add_para(doc, "Main Effort: {{MAIN_EFFORT}}")
     add_para(doc, "End State: GoS and HNSF independently maintain security; corridor secure; SLM neutralized; governance reforms underway.")
 
     doc.add_heading("b. Concept of Operations", level=2)
-    add_para(doc, f"Phase {state.phase_label} ({phase_name}) operations focus on {main_efforts[phase]}. Four LOEs remain mutually supporting. OPERATION RESOLUTE VOICE (MISO) supports all LOEs.")
+    add_para(doc, "Phase {{PHASE_LABEL}} ({{PHASE_NAME}}) operations focus on {{MAIN_EFFORT}}. Four LOEs remain mutually supporting. OPERATION RESOLUTE VOICE (MISO) supports all LOEs.")
 
     doc.add_heading("c. Tasks to Subordinate Units", level=2)
-    tasks = {
-        1: [
-            ("SOTF-C", "Conduct initial assessment of Solaran Army units; begin Swamp Rangers training program."),
-            ("SOTF-K", "Establish ISR architecture along Port Manatee corridor; begin CSG advisory operations."),
-            ("SOTF-B", "Assess border security gaps; begin Border Guard training."),
-            ("MISTF", "Establish Radio Solara Libre; begin MISO Phase I (Prepare and Legitimize)."),
-            ("CATF", "Conduct initial civil-military engagement in priority company towns."),
-        ],
-        2: [
-            ("SOTF-C", "Conduct intensive Swamp Rangers training; begin accompanied patrols into swamp periphery."),
-            ("SOTF-K", "MAIN EFFORT. Establish layered corridor defense with CSG; achieve initial operating capability."),
-            ("SOTF-B", "Conduct border interdiction training; execute joint patrols with HNSF Border Guard."),
-            ("MISTF", "Execute MISO Phase II (Disrupt and Persuade); heavily market amnesty program."),
-            ("CATF", "Scale civil-military projects; begin governance reform advocacy."),
-        ],
-        3: [
-            ("SOTF-C", "MAIN EFFORT. Advise and accompany Swamp Rangers in clearing SLM sanctuaries."),
-            ("SOTF-K", "Sustain and expand corridor security; achieve full operating capability."),
-            ("SOTF-B", "Intensify border interdiction; dismantle SLM smuggling networks."),
-            ("MISTF", "Intensify MISO targeting SLM leadership; begin Grey/Black operations."),
-            ("CATF", "Expand CA projects to secondary company towns; advocate land reform."),
-        ],
-        4: [
-            ("SOTF-C", "Transition Swamp Rangers to independent operations; maintain advisory presence."),
-            ("SOTF-K", "Transfer corridor security lead to CSG; reduce advisory footprint."),
-            ("SOTF-B", "Transition border operations to HNSF; prepare for redeployment."),
-            ("MISTF", "Transfer MISO lead to GoS Ministry of Information."),
-            ("CATF", "Transition CA programs to USAID and GoS agencies."),
-        ],
-    }
-    for i, (unit, task) in enumerate(tasks[phase], 1):
-        add_para(doc, f"({i}) {unit}. {task}", indent=1, space_after=4)
 
+def _opord_closing(doc):
     doc.add_heading("d. Coordinating Instructions", level=2)
-    add_para(doc, f"(1) This OPORD effective {state.eff_dtg}.")
+    add_para(doc, "(1) This OPORD effective {{EFF_DTG}}.")
     add_para(doc, "(2) CCIR: See separate CCIR document.")
     add_para(doc, "(3) ROE: See separate ROE document. U.S. forces under USSOUTHCOM ROE as supplemented.")
     add_para(doc, "(4) Fire Support/Airspace: See ACO and ATO.")
@@ -521,99 +925,142 @@ def generate_opord(state, output_dir):
     add_para(doc, "Major General, USA")
     add_para(doc, "Commanding")
 
-    annexes = ["A-Task Organization","B-Intelligence","C-Operations","D-Fires","E-Protection",
-               "F-Sustainment","G-Engineer","H-Signal","I-Air/Missile Defense","J-Public Affairs",
-               "K-Civil Affairs","L-Information Collection","M-Assessment","N-Space Ops",
-               "O-Omitted","P-Host-Nation Support","Q-KM","R-Reports","S-STO","T-Omitted",
-               "U-IG","V-Interagency","W-OCS","X-Omitted","Y-Omitted","Z-Distribution"]
     add_para(doc, "ANNEXES:", bold=True)
-    for a in annexes:
-        add_para(doc, f"Annex {a}", indent=1, space_after=1)
+    add_multiline_para(doc, [f"Annex {a}" for a in _OPORD_ANNEXES], indent=1, space_after=1)
 
-    add_classification_header_footer(doc)
-    fname = f"OPORD_{phase:03d}-26_Phase_{state.phase_label}_{phase_name.replace(' ','_')}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+_OPORD_BODY = BodyTemplate(_opord_body)
+_OPORD_CLOSING = BodyTemplate(_opord_closing)
 
+_OPORD_ENEMY_ASSESSMENTS = {
+    1: "SLM maintains initiative along the corridor with frequent sabotage. Swamp sanctuaries are largely uncontested. External support flowing freely across the border.",
+    2: "SLM corridor attacks continuing but HNSF response improving. ISR providing increased early warning. SLM adapting tactics, shifting to nighttime operations. Border interdiction beginning to constrain supply.",
+    3: "SLM under pressure across all operating areas. Corridor attacks reduced. Swamp sanctuaries being contested. Amnesty program generating defections. SLM leadership showing signs of internal friction.",
+    4: "SLM significantly degraded. Remnants operating in small, isolated cells. Leadership fragmented. External support severely disrupted. SLM propaganda losing effectiveness.",
+}
+_OPORD_MISSION_VERBS = {
+    1: "establishes the JTF, conducts initial assessments, and begins advisory operations",
+    2: "conducts intensive HNSF training and establishes corridor security",
+    3: "conducts HNSF-led clearing operations and expands security",
+    4: "transitions security lead to HNSF and prepares for redeployment",
+}
+_OPORD_INTENTS = {
+    1: "Establish advisory relationships and ISR architecture to set conditions for decisive operations in subsequent phases.",
+    2: "Build HNSF capacity to independently secure the corridor while degrading SLM freedom of movement.",
+    3: "Press the advantage. HNSF-led operations deny SLM sanctuary while MISO and CA efforts accelerate population support for the GoS.",
+    4: "Ensure HNSF sustainability. Complete transition of all operations. Residual SOF capability for CT only.",
+}
+_OPORD_MAIN_EFFORTS = {1: "LOE 1 (Develop HNSF)", 2: "LOE 2 (Secure Corridor)", 3: "LOE 3 (Counter SLM)", 4: "LOE 1 (Sustain HNSF)"}
+_OPORD_TASKS = {
+    1: (
+        ("SOTF-C", "Conduct initial assessment of Solaran Army units; begin Swamp Rangers training program."),
+        ("SOTF-K", "Establish ISR architecture along Port Manatee corridor; begin CSG advisory operations."),
+        ("SOTF-B", "Assess border security gaps; begin Border Guard training."),
+        ("MISTF", "Establish Radio Solara Libre; begin MISO Phase I (Prepare and Legitimize)."),
+        ("CATF", "Conduct initial civil-military engagement in priority company towns."),
+    ),
+    2: (
+        ("SOTF-C", "Conduct intensive Swamp Rangers training; begin accompanied patrols into swamp periphery."),
+        ("SOTF-K", "MAIN EFFORT. Establish layered corridor defense with CSG; achieve initial operating capability."),
+        ("SOTF-B", "Conduct border interdiction training; execute joint patrols with HNSF Border Guard."),
+        ("MISTF", "Execute MISO Phase II (Disrupt and Persuade); heavily market amnesty program."),
+        ("CATF", "Scale civil-military projects; begin governance reform advocacy."),
+    ),
+    3: (
+        ("SOTF-C", "MAIN EFFORT. Advise and accompany Swamp Rangers in clearing SLM sanctuaries."),
+        ("SOTF-K", "Sustain and expand corridor security; achieve full operating capability."),
+        ("SOTF-B", "Intensify border interdiction; dismantle SLM smuggling networks."),
+        ("MISTF", "Intensify MISO targeting SLM leadership; begin Grey/Black operations."),
+        ("CATF", "Expand CA projects to secondary company towns; advocate land reform."),
+    ),
+    4: (
+        ("SOTF-C", "Transition Swamp Rangers to independent operations; maintain advisory presence."),
+        ("SOTF-K", "Transfer corridor security lead to CSG; reduce advisory footprint."),
+        ("SOTF-B", "Transition border operations to HNSF; prepare for redeployment."),
+        ("MISTF", "Transfer MISO lead to GoS Ministry of Information."),
+        ("CATF", "Transition CA programs to USAID and GoS agencies."),
+    ),
+}
 
-# ------- FRAGO (Daily) -------
+def _make_opord(phase):
+    """Build the OPORD generator for one phase, with its phase text baked in."""
+    info = PHASES[phase]
+    phase_bindings = dict(
+        ENEMY_ASSESSMENT=_OPORD_ENEMY_ASSESSMENTS[phase],
+        MISSION_VERB=_OPORD_MISSION_VERBS[phase],
+        INTENT=_OPORD_INTENTS[phase],
+        MAIN_EFFORT=_OPORD_MAIN_EFFORTS[phase],
+    )
+    refs = _OPORD_REFS
+    if phase > 1:
+        refs += (f"g. JTF-GG OPORD {phase-1:03d}-26 (Previous Phase).",)
+    opening = BodyTemplate(functools.partial(_opord_opening, refs=refs))
+    task_lines = [f"({i}) {unit}. {task}" for i, (unit, task) in enumerate(_OPORD_TASKS[phase], 1)]
+    fname = f"OPORD_{phase:03d}-26_Phase_{info['label']}_{_PHASE_SLUG[phase]}.docx"
 
-def generate_frago(state, output_dir, frago_num):
-    doc = Document()
-    set_narrow_margins(doc)
+    def generate(state, output_dir):
+        doc = scratch_document("OPORD")
 
+        bindings = dict(
+            state.bindings,
+            WEATHER='Dry season; optimal conditions for ground ops and ISR.' if state.day < 150 else 'Wet season approaching; degraded ground mobility in swamp regions anticipated.',
+            CIVIL_STATUS=f"Tip-line calls averaging {state.tip_line_calls}/day. {state.amnesty_surrenders} total amnesty surrenders to date." if state.day > 0 else "Initial engagement underway.",
+            **phase_bindings,
+        )
+
+        opening.render(doc, bindings)
+        _OPORD_BODY.render(doc, bindings)
+        add_multiline_para(doc, task_lines, indent=1, space_after=4)
+        _OPORD_CLOSING.render(doc, bindings)
+
+        add_classification_header_footer(doc)
+        return doc, output_dir + fname
+
+    return generate
+
+_OPORD_BY_PHASE = {phase: _make_opord(phase) for phase in PHASES}
+
+def generate_opord(state, output_dir):
+    return _OPORD_BY_PHASE[state.phase](state, output_dir)
+
+
+# ------- FRAGO (Daily) -------
+
+def _frago_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JOINT TASK FORCE - GROVE GUARDIAN",
-        f"FRAGMENTARY ORDER {frago_num:04d}-26",
-        f"TO OPORD {state.phase:03d}-26 (PHASE {state.phase_label}: {state.phase_name.upper()})",
-        state.dtg,
+        "FRAGMENTARY ORDER {{FRAGO_NUM}}-26",
+        "TO OPORD {{PHASE}}-26 (PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}})",
+        "{{DTG}}",
     ])
 
-    add_para(doc, f"References: JTF-GG OPORD {state.phase:03d}-26; ATO {state.day+1:03d}-26; ACO {state.day+1:03d}-26.", bold=True)
-    add_para(doc, f"Time Zone: ZULU (Z). ATO Day: {state.day+1:03d}.")
+    add_para(doc, "References: JTF-GG OPORD {{PHASE}}-26; ATO {{DAY}}-26; ACO {{DAY}}-26.", bold=True)
+    add_para(doc, "Time Zone: ZULU (Z). ATO Day: {{DAY}}.")
 
     doc.add_heading("1. SITUATION", level=1)
-    add_para(doc, f"a. Enemy. SLM strength estimated at {state.slm_strength}. Corridor threat level: {state.corridor_threat}/10. HNSF readiness: {state.hnsf_readiness}%. GoS popular support: ~{state.popular_support_gos}%.")
-
-    if state.event_texts:
-        add_para(doc, "b. Significant Activities (last 24 hours):", bold=True)
-        for evt in state.event_texts:
-            add_para(doc, f"- {evt}", indent=1, space_after=2)
-    else:
-        add_para(doc, "b. No significant activities in the last 24 hours.")
+    add_para(doc, "a. Enemy. SLM strength estimated at {{SLM_STRENGTH}}. Corridor threat level: {{CORRIDOR_THREAT}}/10. HNSF readiness: {{HNSF_READINESS}}%. GoS popular support: ~{{GOS_SUPPORT}}%.")
 
-    add_para(doc, f"c. Tip-line calls (24hr): {max(0, state.tip_line_calls + random.randint(-3,3))}. Cumulative amnesty surrenders: {state.amnesty_surrenders}.")
+def _frago_execution(doc):
+    add_para(doc, "c. Tip-line calls (24hr): {{TIP_LINE_24HR}}. Cumulative amnesty surrenders: {{AMNESTY_SURRENDERS}}.")
 
     doc.add_heading("2. MISSION", level=1)
     add_para(doc, "No change to OPORD mission statement.")
 
     doc.add_heading("3. EXECUTION", level=1)
-    add_para(doc, f"a. Main Effort: No change. Phase {state.phase_label} ({state.phase_name}) operations continue.")
+    add_para(doc, "a. Main Effort: No change. Phase {{PHASE_LABEL}} ({{PHASE_NAME}}) operations continue.")
 
     add_para(doc, "b. Changes to tasks:", bold=True)
-    # Generate 1-3 task changes per day
-    task_changes = []
-    if state.events:
-        for evt in state.events:
-            if evt[3] == "CONTACT":
-                task_changes.append(f"SOTF-K: Increase CSG patrol frequency in sector of contact. Surge ISR to affected area.")
-            elif evt[3] == "SABOTAGE":
-                task_changes.append(f"SOTF-K: Coordinate with HNSF engineers for rapid repair. Adjust CSG patrol pattern to cover vulnerability.")
-            elif evt[3] == "INTEL":
-                task_changes.append(f"J-2: Develop intelligence lead. Nominate for ISR collection on next ATO cycle.")
-            elif evt[3] == "INTERDICTION":
-                task_changes.append(f"SOTF-B: Exploit captured material. Update border interdiction priorities.")
-            elif evt[3] == "INFO":
-                task_changes.append(f"MISTF: Develop counter-narrative. Coordinate with Radio Solara Libre for broadcast.")
-            elif evt[3] == "CUAS":
-                task_changes.append(f"J-3: Review CUAS posture at all FOBs. Report hostile UAS characteristics to J-2 for analysis.")
-            elif evt[3] == "CYBER":
-                task_changes.append(f"J-6/DCO: Elevate network monitoring. Implement recommended OPSEC changes.")
-            elif evt[3] == "CLEARING":
-                task_changes.append(f"SOTF-C: Exploit site for intelligence. Coordinate with J-2 for detainee processing via HNSF.")
-            elif evt[3] == "CIVIL":
-                task_changes.append(f"CATF: Continue engagement. Report atmospherics to J-2 and MISTF.")
-            else:
-                task_changes.append(f"All units: Continue Phase {state.phase_label} operations as directed.")
 
-    if not task_changes:
-        task_changes.append(f"No changes. Continue Phase {state.phase_label} operations IAW OPORD {state.phase:03d}-26.")
-
-    for i, tc in enumerate(task_changes, 1):
-        add_para(doc, f"({i}) {tc}", indent=1, space_after=3)
-
-    add_para(doc, f"c. CCIR update: {'See updated CCIR document this period.' if state.day % CCIR_INTERVAL == 0 else 'No change to CCIR.'}")
-    add_para(doc, f"d. JIPTL: See JIPTL {state.day+1:03d}-26 for current target priorities.")
-    add_para(doc, f"e. ATO/ACO: See ATO {state.day+1:03d}-26 and ACO {state.day+1:03d}-26.")
+def _frago_coordination(doc):
+    add_para(doc, "c. CCIR update: {{CCIR_UPDATE}}")
+    add_para(doc, "d. JIPTL: See JIPTL {{DAY}}-26 for current target priorities.")
+    add_para(doc, "e. ATO/ACO: See ATO {{DAY}}-26 and ACO {{DAY}}-26.")
 
     doc.add_heading("4. SUSTAINMENT", level=1)
     add_para(doc, "No change unless specified below.")
-    if any(e[3] == "CONTACT" for e in state.events):
-        add_para(doc, "- MEDEVAC: Confirm DUSTOFF status and blood product availability following contact.", indent=1)
 
+def _frago_closing(doc):
     doc.add_heading("5. COMMAND AND SIGNAL", level=1)
     add_para(doc, "No change.")
 
@@ -623,303 +1070,342 @@ def generate_frago(state, output_dir, frago_num):
     add_para(doc, "D.L. SANTOS, COL, USA")
     add_para(doc, "Chief of Staff, JTF-GROVE GUARDIAN")
 
+_FRAGO_OPENING = BodyTemplate(_frago_opening)
+_FRAGO_EXECUTION = BodyTemplate(_frago_execution)
+_FRAGO_COORDINATION = BodyTemplate(_frago_coordination)
+_FRAGO_CLOSING = BodyTemplate(_frago_closing)
+
+# FRAGO task change for each event type
+_EVT_TASK_CHANGES = {
+    "CONTACT": "SOTF-K: Increase CSG patrol frequency in sector of contact. Surge ISR to affected area.",
+    "SABOTAGE": "SOTF-K: Coordinate with HNSF engineers for rapid repair. Adjust CSG patrol pattern to cover vulnerability.",
+    "INTEL": "J-2: Develop intelligence lead. Nominate for ISR collection on next ATO cycle.",
+    "INTERDICTION": "SOTF-B: Exploit captured material. Update border interdiction priorities.",
+    "INFO": "MISTF: Develop counter-narrative. Coordinate with Radio Solara Libre for broadcast.",
+    "CUAS": "J-3: Review CUAS posture at all FOBs. Report hostile UAS characteristics to J-2 for analysis.",
+    "CYBER": "J-6/DCO: Elevate network monitoring. Implement recommended OPSEC changes.",
+    "CLEARING": "SOTF-C: Exploit site for intelligence. Coordinate with J-2 for detainee processing via HNSF.",
+    "CIVIL": "CATF: Continue engagement. Report atmospherics to J-2 and MISTF.",
+}
+# Task change for other event types, and the entry for a day without events, by phase
+_EVT_TASK_CHANGE_DEFAULT = {phase: f"All units: Continue Phase {info['label']} operations as directed."
+                            for phase, info in PHASES.items()}
+_NO_TASK_CHANGES = {phase: f"No changes. Continue Phase {info['label']} operations IAW OPORD {phase:03d}-26."
+                    for phase, info in PHASES.items()}
+
+def generate_frago(state, output_dir, frago_num):
+    doc = scratch_document("FRAGO")
+
+    evt_types = [evt[3] for evt in state.events]
+    bindings = dict(
+        state.bindings,
+        FRAGO_NUM=f"{frago_num:04d}",
+        CCIR_UPDATE='See updated CCIR document this period.' if state.day % CCIR_INTERVAL == 0 else 'No change to CCIR.',
+    )
+
+    _FRAGO_OPENING.render(doc, bindings)
+
+    if state.event_texts:
+        add_para(doc, "b. Significant Activities (last 24 hours):", bold=True)
+        add_paras(doc, (f"- {evt}" for evt in state.event_texts), indent=1, space_after=2)
+    else:
+        add_para(doc, "b. No significant activities in the last 24 hours.")
+
+    _FRAGO_EXECUTION.render(doc, bindings)
+
+    # Generate 1-3 task changes per day
+    default_change = _EVT_TASK_CHANGE_DEFAULT[state.phase]
+    task_changes = ([_EVT_TASK_CHANGES.get(evt_type, default_change) for evt_type in evt_types]
+                    or [_NO_TASK_CHANGES[state.phase]])
+
+    add_paras(doc, (f"({i}) {tc}" for i, tc in enumerate(task_changes, 1)), indent=1, space_after=3)
+
+    _FRAGO_COORDINATION.render(doc, bindings)
+    if "CONTACT" in evt_types:
+        add_para(doc, "- MEDEVAC: Confirm DUSTOFF status and blood product availability following contact.", indent=1)
+    _FRAGO_CLOSING.render(doc, bindings)
+
     add_classification_header_footer(doc)
-    fname = f"FRAGO_{frago_num:04d}-26_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"FRAGO_{frago_num:04d}-26_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- ATO (Daily) -------
 
-def generate_ato(state, output_dir):
-    doc = Document()
-    set_narrow_margins(doc)
-
+def _ato_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JOINT TASK FORCE - GROVE GUARDIAN",
-        f"AIR TASKING ORDER {state.day+1:03d}-26",
-        f"DTG: {state.dtg}",
-        f"EFFECTIVE: {state.eff_dtg} TO {state.end_dtg}",
-        f"ATO DAY: {state.day+1:03d} | PHASE {state.phase_label}: {state.phase_name.upper()}",
+        "AIR TASKING ORDER {{DAY}}-26",
+        "DTG: {{DTG}}",
+        "EFFECTIVE: {{EFF_DTG}} TO {{END_DTG}}",
+        "ATO DAY: {{DAY}} | PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}}",
     ])
 
     doc.add_heading("SECTION 1: GENERAL", level=1)
-    add_para(doc, f"References: OPORD {state.phase:03d}-26; ACO {state.day+1:03d}-26; ROE (current).")
-    add_para(doc, f"Situation: Phase {state.phase_label} operations. SLM threat level along corridor: {state.corridor_threat}/10. HNSF readiness: {state.hnsf_readiness}%.")
-    add_para(doc, f"Weather: {'Dry season; CAVU expected. Morning fog in swamp areas 0500-0800L.' if state.day < 150 else 'Wet season; scattered thunderstorms possible. Ceiling variable 800-unlimited.'}")
+    add_para(doc, "References: OPORD {{PHASE}}-26; ACO {{DAY}}-26; ROE (current).")
+    add_para(doc, "Situation: Phase {{PHASE_LABEL}} operations. SLM threat level along corridor: {{CORRIDOR_THREAT}}/10. HNSF readiness: {{HNSF_READINESS}}%.")
+    add_para(doc, "Weather: {{WEATHER}}")
 
     doc.add_heading("SECTION 2: MISSION TASKING", level=1)
-    table = doc.add_table(rows=1, cols=8)
-    table.style = 'Table Grid'
-    headers = ["MSN #", "CALLSIGN", "ACFT TYPE", "UNIT", "MSN TYPE", "TARGET/AREA", "TOT/ON-STATION", "REMARKS"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-        for p in table.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(8)
-        set_cell_shading(table.rows[0].cells[i], "D9E2F3")
-
-    for m in state.ato_missions:
-        row = table.add_row()
-        vals = [m["msn_num"], m["callsign"], m["acft"], m["unit"], m["msn_type"], m["target_area"], m["tot"], m["remarks"]]
-        for i, val in enumerate(vals):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(8)
 
+def _ato_spins(doc):
     doc.add_heading("SECTION 3: SPINS (SUMMARY)", level=1)
-    add_para(doc, "a. All UAS ops comply with ACO. Lost link: RTB profile. Notify JTF JOC immediately.")
-    add_para(doc, "b. UAS will not overfly populated areas below 500ft AGL without JTF JOC approval.")
-    add_para(doc, f"c. MEDEVAC: DUSTOFF on standby; 60-min response. FM 38.50 / SATCOM GROVE-MED-1.")
-    add_para(doc, "d. CUAS: Report hostile UAS to JTF JOC. EW engagement authorized; kinetic requires CDR approval except self-defense.")
-    add_para(doc, "e. ROE: Per current ROE. PID required for all engagements.")
-    add_para(doc, f"f. Total missions this ATO: {len(state.ato_missions)}. ISR: {sum(1 for m in state.ato_missions if m['msn_type']=='ISR')}. Support: {sum(1 for m in state.ato_missions if m['msn_type']!='ISR')}.")
+    add_multiline_para(doc, [
+        "a. All UAS ops comply with ACO. Lost link: RTB profile. Notify JTF JOC immediately.",
+        "b. UAS will not overfly populated areas below 500ft AGL without JTF JOC approval.",
+        "c. MEDEVAC: DUSTOFF on standby; 60-min response. FM 38.50 / SATCOM GROVE-MED-1.",
+        "d. CUAS: Report hostile UAS to JTF JOC. EW engagement authorized; kinetic requires CDR approval except self-defense.",
+        "e. ROE: Per current ROE. PID required for all engagements.",
+        "f. Total missions this ATO: {{MSN_TOTAL}}. ISR: {{MSN_ISR}}. Support: {{MSN_SUPPORT}}.",
+    ])
+
+def _ato_table(doc):
+    set_narrow_margins(doc)
+    table = add_header_table(doc, ["MSN #", "CALLSIGN", "ACFT TYPE", "UNIT", "MSN TYPE", "TARGET/AREA", "TOT/ON-STATION", "REMARKS"], 8, _BLUE)
+    fill_cells(table.add_row().cells, slot_values(8), 8)
+
+_ATO_OPENING = BodyTemplate(_ato_opening)
+_ATO_TABLE = TableTemplate(_ato_table)
+_ATO_SPINS = BodyTemplate(_ato_spins)
+
+def generate_ato(state, output_dir):
+    doc = scratch_document("ATO")
+
+    _ATO_OPENING.render(doc, dict(
+        state.bindings,
+        WEATHER='Dry season; CAVU expected. Morning fog in swamp areas 0500-0800L.' if state.day < 150 else 'Wet season; scattered thunderstorms possible. Ceiling variable 800-unlimited.',
+    ))
+    _ATO_TABLE.render(doc, (
+        (0, [m["msn_num"], m["callsign"], m["acft"], m["unit"], m["msn_type"], m["target_area"], m["tot"], m["remarks"]])
+        for m in state.ato_missions
+    ))
+
+    n_isr = sum(1 for m in state.ato_missions if m['msn_type'] == 'ISR')
+    _ATO_SPINS.render(doc, dict(
+        MSN_TOTAL=str(len(state.ato_missions)),
+        MSN_ISR=str(n_isr),
+        MSN_SUPPORT=str(len(state.ato_missions) - n_isr),
+    ))
 
     add_classification_header_footer(doc)
-    fname = f"ATO_{state.day+1:03d}-26_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"ATO_{state.day_str}-26_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- ACO (Daily) -------
 
-def generate_aco(state, output_dir):
-    doc = Document()
-    set_narrow_margins(doc)
-
+def _aco_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JOINT TASK FORCE - GROVE GUARDIAN",
-        f"AIRSPACE CONTROL ORDER {state.day+1:03d}-26",
-        f"DTG: {state.dtg}",
-        f"EFFECTIVE: {state.eff_dtg} TO {state.end_dtg}",
+        "AIRSPACE CONTROL ORDER {{DAY}}-26",
+        "DTG: {{DTG}}",
+        "EFFECTIVE: {{EFF_DTG}} TO {{END_DTG}}",
     ])
 
     doc.add_heading("1. GENERAL", level=1)
-    add_para(doc, f"ACMs approved by ACA (JTF J-3/Air) for ATO Day {state.day+1:03d}. Disseminated via this ACO.")
+    add_para(doc, "ACMs approved by ACA (JTF J-3/Air) for ATO Day {{DAY}}. Disseminated via this ACO.")
 
     doc.add_heading("2. AIRSPACE COORDINATING MEASURES (ACMs)", level=1)
-    table = doc.add_table(rows=1, cols=7)
-    table.style = 'Table Grid'
-    acm_h = ["ACM #", "TYPE", "NAME", "LOCATION", "ALTITUDE", "EFFECTIVE", "CTRL AGENCY"]
-    for i, h in enumerate(acm_h):
-        table.rows[0].cells[i].text = h
-        for p in table.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(8)
-        set_cell_shading(table.rows[0].cells[i], "D9E2F3")
-
-    acm_types = ["ROZ", "UA", "HIDACZ", "ACA"]
-    acm_names = ["SHADOW NORTH", "SHADOW SOUTH", "RAVEN CENTRAL", "RAVEN BORDER",
-                 "SCAN PORT", "CORRIDOR SHIELD", "CAMP CITRUS", "PUMA URBAN",
-                 "SWAMP OVERWATCH", "BORDER WATCH"]
-    acm_bases = [
-        ("N27 30 00 W081 45 00 / 20nm", "SFC-15000ft MSL"),
-        ("N27 00 00 W081 30 00 / 20nm", "SFC-15000ft MSL"),
-        ("N27 15 00 W081 50 00 / 10nm", "SFC-1200ft AGL"),
-        ("N27 20 00 W081 15 00 / 10nm", "SFC-1200ft AGL"),
-        ("N27 40 00 W082 30 00 / 15nm", "SFC-10000ft MSL"),
-        ("N27 00-40 W081 30-W082 30 / 5nm corridor", "SFC-5000ft AGL"),
-        ("N27 12 00 W081 46 00 / 3nm", "SFC-3000ft AGL"),
-        ("N27 12 00 W081 46 00 / 5nm", "SFC-500ft AGL"),
-        ("N27 10 00 W081 55 00 / 12nm", "SFC-8000ft MSL"),
-        ("N27 25 00 W081 10 00 / 10nm", "SFC-5000ft AGL"),
-    ]
-
-    random.seed(42 + state.day)
-    n_acms = min(state.acm_count, len(acm_names))
-    selected = random.sample(range(len(acm_names)), n_acms)
 
+def _aco_closing(doc):
+    add_para(doc, "")
+    add_para(doc, f"Approved: R.P. THORNTON, COL, USAF — ACA (Delegated)", bold=True)
+
+def _acm_table(doc):
+    set_narrow_margins(doc)
+    table = add_header_table(doc, ["ACM #", "TYPE", "NAME", "LOCATION", "ALTITUDE", "EFFECTIVE", "CTRL AGENCY"], 8, _BLUE)
+    fill_cells(table.add_row().cells, slot_values(7), 8)
+
+def _fscm_table(doc):
+    set_narrow_margins(doc)
+    doc.add_heading("3. FIRE SUPPORT COORDINATION MEASURES (FSCMs)", level=1)
+    table = add_header_table(doc, ["FSCM #", "TYPE", "NAME", "LOCATION", "EFFECTIVE", "EST. AUTH."], 8, _GREEN)
+    fill_cells(table.add_row().cells, slot_values(6), 8)
+
+_ACO_OPENING = BodyTemplate(_aco_opening)
+_ACO_CLOSING = BodyTemplate(_aco_closing)
+_ACM_TABLE = TableTemplate(_acm_table)
+_FSCM_TABLE = TableTemplate(_fscm_table)
+
+_ACM_TYPES = ("ROZ", "UA", "HIDACZ", "ACA")
+_ACM_NAMES = ("SHADOW NORTH", "SHADOW SOUTH", "RAVEN CENTRAL", "RAVEN BORDER",
+              "SCAN PORT", "CORRIDOR SHIELD", "CAMP CITRUS", "PUMA URBAN",
+              "SWAMP OVERWATCH", "BORDER WATCH")
+_ACM_BASES = (
+    ("N27 30 00 W081 45 00 / 20nm", "SFC-15000ft MSL"),
+    ("N27 00 00 W081 30 00 / 20nm", "SFC-15000ft MSL"),
+    ("N27 15 00 W081 50 00 / 10nm", "SFC-1200ft AGL"),
+    ("N27 20 00 W081 15 00 / 10nm", "SFC-1200ft AGL"),
+    ("N27 40 00 W082 30 00 / 15nm", "SFC-10000ft MSL"),
+    ("N27 00-40 W081 30-W082 30 / 5nm corridor", "SFC-5000ft AGL"),
+    ("N27 12 00 W081 46 00 / 3nm", "SFC-3000ft AGL"),
+    ("N27 12 00 W081 46 00 / 5nm", "SFC-500ft AGL"),
+    ("N27 10 00 W081 55 00 / 12nm", "SFC-8000ft MSL"),
+    ("N27 25 00 W081 10 00 / 10nm", "SFC-5000ft AGL"),
+)
+_FSCM_DATA = (
+    ("NFA", "ARCADIA CITY", "5km radius Arcadia center", "CONTINUOUS"),
+    ("NFA", "PORT MANATEE", "3km radius Port Manatee", "CONTINUOUS"),
+    ("RFA", "CORRIDOR ZONE", "5km either side PM corridor", "CONTINUOUS"),
+    ("NFA", "EMBASSY COMPOUND", "1km radius U.S. Embassy", "CONTINUOUS"),
+    ("CFL", "BORDER CFL", "Along international border", "CONTINUOUS"),
+    ("NFA", "HOSPITAL ZONE", "500m radius Arcadia General", "CONTINUOUS"),
+    ("FFA", "SWAMP CLEAR", "Designated SLM sanctuary area", "ON ORDER"),
+    ("RFA", "COMPANY TOWN BUFFER", "2km radius Company Towns 1-5", "CONTINUOUS"),
+)
+
+def generate_aco(state, output_dir):
+    doc = scratch_document("ACO")
+
+    _ACO_OPENING.render(doc, state.bindings)
+    rng = random.Random(42 + state.day)
+    n_acms = min(state.acm_count, len(_ACM_NAMES))
+    selected = rng.sample(range(len(_ACM_NAMES)), n_acms)
+
+    acm_rows = []
     for idx, sel in enumerate(selected, 1):
-        row = table.add_row()
-        acm_type = acm_types[sel % len(acm_types)]
-        vals = [
-            f"ACM-{idx:02d}", acm_type, acm_names[sel],
-            acm_bases[sel][0], acm_bases[sel][1],
+        acm_type = _ACM_TYPES[sel % len(_ACM_TYPES)]
+        acm_rows.append((0, [
+            f"ACM-{idx:02d}", acm_type, _ACM_NAMES[sel],
+            _ACM_BASES[sel][0], _ACM_BASES[sel][1],
             f"{state.eff_dtg}-{state.end_dtg}" if acm_type != "ACA" else "CONTINUOUS",
-            "JTF JOC" if acm_type in ["ROZ","HIDACZ","ACA"] else random.choice(["SOTF-C","SOTF-K","SOTF-B","CATF"]),
-        ]
-        for i, val in enumerate(vals):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(8)
+            "JTF JOC" if acm_type in ["ROZ","HIDACZ","ACA"] else rng.choice(["SOTF-C","SOTF-K","SOTF-B","CATF"]),
+        ]))
+    _ACM_TABLE.render(doc, acm_rows)
 
-    doc.add_heading("3. FIRE SUPPORT COORDINATION MEASURES (FSCMs)", level=1)
-    table2 = doc.add_table(rows=1, cols=6)
-    table2.style = 'Table Grid'
-    fscm_h = ["FSCM #", "TYPE", "NAME", "LOCATION", "EFFECTIVE", "EST. AUTH."]
-    for i, h in enumerate(fscm_h):
-        table2.rows[0].cells[i].text = h
-        for p in table2.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(8)
-        set_cell_shading(table2.rows[0].cells[i], "E2EFDA")
-
-    fscm_data = [
-        ("NFA", "ARCADIA CITY", "5km radius Arcadia center", "CONTINUOUS"),
-        ("NFA", "PORT MANATEE", "3km radius Port Manatee", "CONTINUOUS"),
-        ("RFA", "CORRIDOR ZONE", "5km either side PM corridor", "CONTINUOUS"),
-        ("NFA", "EMBASSY COMPOUND", "1km radius U.S. Embassy", "CONTINUOUS"),
-        ("CFL", "BORDER CFL", "Along international border", "CONTINUOUS"),
-        ("NFA", "HOSPITAL ZONE", "500m radius Arcadia General", "CONTINUOUS"),
-        ("FFA", "SWAMP CLEAR", "Designated SLM sanctuary area", "ON ORDER"),
-        ("RFA", "COMPANY TOWN BUFFER", "2km radius Company Towns 1-5", "CONTINUOUS"),
-    ]
-    n_fscms = min(state.fscm_count, len(fscm_data))
-    for idx in range(n_fscms):
-        row = table2.add_row()
-        fd = fscm_data[idx]
-        vals = [f"FSCM-{idx+1:02d}", fd[0], fd[1], fd[2], fd[3], "JTF CDR"]
-        for i, val in enumerate(vals):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(8)
+    n_fscms = min(state.fscm_count, len(_FSCM_DATA))
+    _FSCM_TABLE.render(doc, (
+        (0, [f"FSCM-{idx+1:02d}", fd[0], fd[1], fd[2], fd[3], "JTF CDR"])
+        for idx, fd in enumerate(_FSCM_DATA[:n_fscms])
+    ))
 
-    add_para(doc, "")
-    add_para(doc, f"Approved: R.P. THORNTON, COL, USAF — ACA (Delegated)", bold=True)
+    _ACO_CLOSING.render(doc, {})
 
-    random.seed(42)
     add_classification_header_footer(doc)
-    fname = f"ACO_{state.day+1:03d}-26_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"ACO_{state.day_str}-26_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- JIPTL (Daily) -------
 
-def generate_jiptl(state, output_dir):
-    doc = Document()
-    set_narrow_margins(doc)
-    for section in doc.sections:
-        section.orientation = WD_ORIENT.LANDSCAPE
-        w, h = section.page_height, section.page_width
-        section.page_width = w
-        section.page_height = h
-
+def _jiptl_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JTF-GROVE GUARDIAN — JIPTL",
-        f"JIPTL {state.day+1:03d}-26 | DTG: {state.dtg} | ATO DAY {state.day+1:03d}",
-        f"PHASE {state.phase_label}: {state.phase_name.upper()}",
+        "JIPTL {{DAY}}-26 | DTG: {{DTG}} | ATO DAY {{DAY}}",
+        "PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}}",
         "APPROVED: JTCB / JTF COMMANDER",
     ])
 
     add_para(doc, f"Targeting guidance: Priority (1) SLM logistics/external support; (2) SLM C2; (3) SLM sanctuaries; (4) SLM info ops. CDE required. HNSF concurrence required. Non-lethal preferred.", size=10)
 
+# JIPTL row kinds, in the order _jiptl_table lays out their sample rows
+_NOMINATED, _CUT_LINE, _BELOW_CUT = range(3)
+
+def _jiptl_table(doc):
+    set_narrow_margins(doc, landscape=True)
     cols = 10
-    table = doc.add_table(rows=1, cols=cols)
-    table.style = 'Table Grid'
-    headers = ["PRI", "TGT ID", "TARGET NAME", "CAT", "LOCATION", "DESIRED EFFECT", "CDE", "NOMINATOR", "OBJ", "STATUS"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-        for p in table.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(7)
-        set_cell_shading(table.rows[0].cells[i], "D9E2F3")
-
-    effects = ["DESTROY", "NEUTRALIZE", "DENY", "DISRUPT", "DISRUPT (NON-LETHAL)", "DEGRADE"]
-    nominators = ["SOTF-C", "SOTF-K", "SOTF-B", "MISTF", "CATF", "J-2"]
-    objectives = ["OBJ 1: Secure Corridor", "OBJ 2: Neutralize SLM", "OBJ 3: Counter SLM", "OBJ 4: Isolate"]
-
-    random.seed(42 + state.day)
+    table = add_header_table(doc, ["PRI", "TGT ID", "TARGET NAME", "CAT", "LOCATION", "DESIRED EFFECT", "CDE", "NOMINATOR", "OBJ", "STATUS"], 7, _BLUE)
+    fill_cells(table.add_row().cells, slot_values(cols), 7)
+
+    cut_row = table.add_row()
+    merged = cut_row.cells[0].merge(cut_row.cells[cols-1])
+    merged.text = "--- CUT LINE ---"
+    for p in merged.paragraphs:
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        for r in p.runs:
+            r.bold = True
+            r.font.size = _PT8
+            r.font.color.rgb = _RGB_RED
+    set_cell_shading(merged, _RED)
+
+    cells = table.add_row().cells
+    fill_cells(cells, slot_values(cols), 7)
+    for cell in cells:
+        set_cell_shading(cell, _YELLOW)
+
+_JIPTL_OPENING = BodyTemplate(_jiptl_opening)
+_JIPTL_TABLE = TableTemplate(_jiptl_table)
+
+_JIPTL_EFFECTS = ("DESTROY", "NEUTRALIZE", "DENY", "DISRUPT", "DISRUPT (NON-LETHAL)", "DEGRADE")
+_JIPTL_NOMINATORS = ("SOTF-C", "SOTF-K", "SOTF-B", "MISTF", "CATF", "J-2")
+_JIPTL_OBJECTIVES = ("OBJ 1: Secure Corridor", "OBJ 2: Neutralize SLM", "OBJ 3: Counter SLM", "OBJ 4: Isolate")
+
+def generate_jiptl(state, output_dir):
+    doc = scratch_document("JIPTL", landscape=True)
+
+    _JIPTL_OPENING.render(doc, state.bindings)
+
+    rng = random.Random(42 + state.day)
+    # Jittered locations for every target on the list, keyed by target ID.
+    # active_targets is the above-cut list followed by the below-cut list.
+    locations = {tgt[0]: jitter_mgrs(tgt[3], offset)
+                 for tgt, offset in zip(state.active_targets, jitter_offsets(len(state.active_targets), rng))}
+    rows = []
     for pri, tgt in enumerate(state.jiptl_above_cut, 1):
-        row = table.add_row()
-        vals = [
-            str(pri), tgt[0], tgt[1], tgt[2], jitter_mgrs(tgt[3]),
-            random.choice(effects[:4]) if tgt[2] != "INFO OPS" else "DISRUPT (NON-LETHAL)",
+        rows.append((_NOMINATED, [
+            str(pri), tgt[0], tgt[1], tgt[2], locations[tgt[0]],
+            rng.choice(_JIPTL_EFFECTS[:4]) if tgt[2] != "INFO OPS" else "DISRUPT (NON-LETHAL)",
             tgt[4],
-            random.choice(nominators),
-            random.choice(objectives),
+            rng.choice(_JIPTL_NOMINATORS),
+            rng.choice(_JIPTL_OBJECTIVES),
             "NOMINATED",
-        ]
-        for i, val in enumerate(vals):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(7)
+        ]))
 
     # Cut line
     if state.jiptl_below_cut:
-        cut_row = table.add_row()
-        merged = cut_row.cells[0].merge(cut_row.cells[cols-1])
-        merged.text = "--- CUT LINE ---"
-        for p in merged.paragraphs:
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(8)
-                r.font.color.rgb = RGBColor(255, 0, 0)
-        set_cell_shading(merged, "FFC7CE")
-
+        rows.append((_CUT_LINE, ()))
         for pri_offset, tgt in enumerate(state.jiptl_below_cut, len(state.jiptl_above_cut)+1):
-            row = table.add_row()
-            vals = [
-                str(pri_offset), tgt[0], tgt[1], tgt[2], jitter_mgrs(tgt[3]),
-                random.choice(effects),
+            rows.append((_BELOW_CUT, [
+                str(pri_offset), tgt[0], tgt[1], tgt[2], locations[tgt[0]],
+                rng.choice(_JIPTL_EFFECTS),
                 tgt[4],
-                random.choice(nominators),
-                random.choice(objectives),
+                rng.choice(_JIPTL_NOMINATORS),
+                rng.choice(_JIPTL_OBJECTIVES),
                 "BELOW CUT",
-            ]
-            for i, val in enumerate(vals):
-                row.cells[i].text = val
-                for p in row.cells[i].paragraphs:
-                    for r in p.runs:
-                        r.font.size = Pt(7)
-            for cell in row.cells:
-                set_cell_shading(cell, "FFF2CC")
-
-    random.seed(42)
+            ]))
+    _JIPTL_TABLE.render(doc, rows)
+
     add_classification_header_footer(doc)
-    fname = f"JIPTL_{state.day+1:03d}-26_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"JIPTL_{state.day_str}-26_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- ROE (Phase transitions + amendments) -------
 
-def generate_roe(state, output_dir, roe_version=1):
-    doc = Document()
-    set_narrow_margins(doc)
+_ROE_RULES = (
+    "2.1 Self-Defense: Inherent right retained at all times.",
+    "2.2 Defense of HNSF: Authorized when HNSF subject to hostile act/intent and unable to self-defend. Authority: On-scene CDR (O-5+) or SOTF CDR.",
+    "2.3 Defense of Designated Persons: Authorized per SJA-maintained designated persons list.",
+    "2.4 Proportionality: Force proportional to threat; minimum necessary.",
+    "2.5 Discrimination: PID required before engagement.",
+    "2.6 Minimum Force: Use least force necessary. EOF procedures when time permits.",
+)
 
+def _roe_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JOINT TASK FORCE - GROVE GUARDIAN",
-        f"RULES OF ENGAGEMENT (VERSION {roe_version})",
-        f"DTG: {state.dtg}",
-        f"EFFECTIVE PHASE {state.phase_label}: {state.phase_name.upper()}",
+        "RULES OF ENGAGEMENT (VERSION {{ROE_VERSION}})",
+        "DTG: {{DTG}}",
+        "EFFECTIVE PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}}",
     ])
 
     doc.add_heading("1. SITUATION", level=1)
-    add_para(doc, f"JTF-GG conducts FID/COIN in the Republic of Solara. Phase {state.phase_label} ({state.phase_name}). SLM est. strength: {state.slm_strength}. These ROE supplement USSOUTHCOM Standing ROE.")
+    add_para(doc, "JTF-GG conducts FID/COIN in the Republic of Solara. Phase {{PHASE_LABEL}} ({{PHASE_NAME}}). SLM est. strength: {{SLM_STRENGTH}}. These ROE supplement USSOUTHCOM Standing ROE.")
 
     doc.add_heading("2. GENERAL ROE", level=1)
-    rules = [
-        "2.1 Self-Defense: Inherent right retained at all times.",
-        "2.2 Defense of HNSF: Authorized when HNSF subject to hostile act/intent and unable to self-defend. Authority: On-scene CDR (O-5+) or SOTF CDR.",
-        "2.3 Defense of Designated Persons: Authorized per SJA-maintained designated persons list.",
-        "2.4 Proportionality: Force proportional to threat; minimum necessary.",
-        "2.5 Discrimination: PID required before engagement.",
-        "2.6 Minimum Force: Use least force necessary. EOF procedures when time permits.",
-    ]
-    for r in rules:
-        add_para(doc, r, space_after=4)
+    add_paras(doc, _ROE_RULES, space_after=4)
 
     doc.add_heading("3. SPECIFIC PROVISIONS", level=1)
     add_para(doc, "3.1 SLM Status: NOT declared hostile force. Engagement requires hostile act/hostile intent only.")
@@ -928,19 +1414,19 @@ def generate_roe(state, output_dir, roe_version=1):
     add_para(doc, "3.4 Cross-Border: NOT authorized without JTF CDR + USSOUTHCOM approval.")
     add_para(doc, "3.5 UAS: ISR only (unarmed). EW CUAS authorized; kinetic CUAS requires CDR approval except self-defense.")
 
-    # Phase-specific amendments
-    if state.phase >= 2:
-        doc.add_heading("4. PHASE-SPECIFIC AMENDMENTS", level=1)
-        if state.phase == 2:
-            add_para(doc, "4.1 Accompanied Operations: U.S. advisors accompanying HNSF on corridor patrols may use force in collective self-defense of the combined element.")
-            add_para(doc, "4.2 Escalation: During HNSF-led checkpoint operations, U.S. advisors will defer to HNSF EOF procedures unless U.S. lives are directly threatened.")
-        elif state.phase == 3:
-            add_para(doc, "4.1 Clearing Operations: During HNSF-led clearing operations in designated areas, U.S. advisors may call for fire support in coordination with HNSF commander when combined element is decisively engaged.")
-            add_para(doc, "4.2 FFA Activation: JTF CDR may activate FFA SWAMP CLEAR (FSCM-07) for specific HNSF-led clearing operations. All fires require HNSF commander approval.")
-        elif state.phase == 4:
-            add_para(doc, "4.1 Reduced Posture: As HNSF assumes security lead, U.S. force protection posture remains unchanged. No reduction in self-defense authorities.")
-            add_para(doc, "4.2 Residual CT: Any CT operations require JTF CDR + USSOUTHCOM approval.")
+def _roe_amendments(doc, phase):
+    doc.add_heading("4. PHASE-SPECIFIC AMENDMENTS", level=1)
+    if phase == 2:
+        add_para(doc, "4.1 Accompanied Operations: U.S. advisors accompanying HNSF on corridor patrols may use force in collective self-defense of the combined element.")
+        add_para(doc, "4.2 Escalation: During HNSF-led checkpoint operations, U.S. advisors will defer to HNSF EOF procedures unless U.S. lives are directly threatened.")
+    elif phase == 3:
+        add_para(doc, "4.1 Clearing Operations: During HNSF-led clearing operations in designated areas, U.S. advisors may call for fire support in coordination with HNSF commander when combined element is decisively engaged.")
+        add_para(doc, "4.2 FFA Activation: JTF CDR may activate FFA SWAMP CLEAR (FSCM-07) for specific HNSF-led clearing operations. All fires require HNSF commander approval.")
+    elif phase == 4:
+        add_para(doc, "4.1 Reduced Posture: As HNSF assumes security lead, U.S. force protection posture remains unchanged. No reduction in self-defense authorities.")
+        add_para(doc, "4.2 Residual CT: Any CT operations require JTF CDR + USSOUTHCOM approval.")
 
+def _roe_closing(doc):
     doc.add_heading("5. EOF PROCEDURES", level=1)
     add_para(doc, "SHOUT > SHOW > SHOVE > SHOOT (Warning) > SHOOT (Neutralize)")
 
@@ -951,232 +1437,482 @@ def generate_roe(state, output_dir, roe_version=1):
     add_para(doc, "J.R. MACKENZIE, MG, USA — Commander, JTF-GG", bold=True)
     add_para(doc, "Legal Review: T.M. HARGROVE, COL, JA — SJA, JTF-GG")
 
+_ROE_OPENING = BodyTemplate(_roe_opening)
+_ROE_AMENDMENTS = {phase: BodyTemplate(functools.partial(_roe_amendments, phase=phase)) for phase in (2, 3, 4)}
+_ROE_CLOSING = BodyTemplate(_roe_closing)
+
+def generate_roe(state, output_dir, roe_version=1):
+    doc = scratch_document("ROE")
+
+    _ROE_OPENING.render(doc, dict(state.bindings, ROE_VERSION=str(roe_version)))
+    # Phase-specific amendments
+    if state.phase in _ROE_AMENDMENTS:
+        _ROE_AMENDMENTS[state.phase].render(doc, {})
+    _ROE_CLOSING.render(doc, {})
+
     add_classification_header_footer(doc)
-    fname = f"ROE_V{roe_version:02d}_Phase_{state.phase_label}_{state.phase_name.replace(' ','_')}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"ROE_V{roe_version:02d}_Phase_{state.phase_label}_{_PHASE_SLUG[state.phase]}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- CCIR (Periodic) -------
 
-def generate_ccir(state, output_dir, ccir_num):
-    doc = Document()
-    set_narrow_margins(doc)
-
+def _ccir_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JTF-GROVE GUARDIAN",
-        f"CCIR UPDATE {ccir_num:03d} | DTG: {state.dtg}",
-        f"PHASE {state.phase_label}: {state.phase_name.upper()} | DAY {state.day+1:03d}",
+        "CCIR UPDATE {{CCIR_NUM}} | DTG: {{DTG}}",
+        "PHASE {{PHASE_LABEL}}: {{PHASE_NAME_UPPER}} | DAY {{DAY}}",
     ])
 
     doc.add_heading("PRIORITY INTELLIGENCE REQUIREMENTS (PIR)", level=1)
-    pir_table = doc.add_table(rows=1, cols=3)
-    pir_table.style = 'Table Grid'
-    for i, h in enumerate(["PIR", "REQUIREMENT", "DECISION POINT"]):
-        pir_table.rows[0].cells[i].text = h
-        for p in pir_table.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(9)
-        set_cell_shading(pir_table.rows[0].cells[i], "D9E2F3")
 
-    # PIRs evolve by phase
-    phase_pirs = {
-        1: [
-            ("PIR 1", "SLM intentions/timeline for corridor attacks", "Adjust CSG posture"),
-            ("PIR 2", "SLM OOB, cell structure, leadership", "Prioritize SOTF-C ops"),
-            ("PIR 3", "Cross-border logistics routes/methods", "Adjust SOTF-B interdiction"),
-            ("PIR 4", "Popular support levels (Grove Laborers/Scrub Folk)", "Shape MISO strategy"),
-            ("PIR 5", "SLM advanced weapons (MANPADS, UAS)", "Adjust force protection"),
-            ("PIR 6", "SLM/sponsor cyber capabilities", "Elevate DCO posture"),
-        ],
-        2: [
-            ("PIR 1", "SLM adaptation to corridor security measures", "Adjust CSG TTPs"),
-            ("PIR 2", "SLM OOB changes and leadership movements", "Sequence clearing ops"),
-            ("PIR 3", "Cross-border logistics; effectiveness of interdiction", "Adjust border ops"),
-            ("PIR 4", "Population response to MISO and CA programs", "Redirect MISO/CA"),
-            ("PIR 5", "SLM advanced weapons acquisition", "Adjust force protection"),
-            ("PIR 6", "SLM cyber targeting of HNSF C2 systems", "Harden networks"),
-        ],
-        3: [
-            ("PIR 1", "SLM intentions to escalate or negotiate", "Inform CDR decision on operational tempo"),
-            ("PIR 2", "SLM remaining capability and cohesion", "Prioritize remaining clearing ops"),
-            ("PIR 3", "Foreign sponsor commitment level", "Inform diplomatic approach"),
-            ("PIR 4", "Population confidence in GoS reforms", "Advise GoS on reform pace"),
-            ("PIR 5", "SLM IED/sabotage residual capability", "Maintain corridor security"),
-            ("PIR 6", "SLM information ops effectiveness", "Counter remaining propaganda"),
-        ],
-        4: [
-            ("PIR 1", "SLM reconstitution potential", "Determine residual CT requirement"),
-            ("PIR 2", "HNSF sustainability without U.S. support", "Determine transition timeline"),
-            ("PIR 3", "Foreign sponsor future intentions", "Inform post-transition posture"),
-            ("PIR 4", "Population confidence trajectory", "Advise GoS on long-term stability"),
-            ("PIR 5", "Residual SLM cells and spoiler potential", "Maintain awareness"),
-            ("PIR 6", "GoS governance reform follow-through", "Shape final advisory messaging"),
-        ],
-    }
-    for pir_data in phase_pirs.get(state.phase, phase_pirs[1]):
-        row = pir_table.add_row()
-        for i, val in enumerate(pir_data):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(9)
+def _ccir_closing(doc):
+    doc.add_heading("EEFI", level=1)
+    add_paras(doc, (f"EEFI {i}: {e}" for i, e in enumerate(_CCIR_EEFIS, 1)), indent=1, space_after=2)
+    add_para(doc, "")
+    add_para(doc, "Next CCIR review: {{NEXT_REVIEW_DTG}}", bold=True)
+    add_para(doc, "J.R. MACKENZIE, MG, USA — Commander, JTF-GG")
+
+_CCIR_EEFIS = ("SOF team locations/patterns", "ISR capabilities/gaps", "Intel sharing arrangements",
+               "CUAS capabilities", "MEDEVAC/PR procedures", "Comms architecture", "HNSF op timelines")
+
+def _ccir_pir_table(doc):
+    set_narrow_margins(doc)
+    table = add_header_table(doc, ["PIR", "REQUIREMENT", "DECISION POINT"], 9, _BLUE)
+    fill_cells(table.add_row().cells, slot_values(3), 9)
 
+def _ccir_ffir_table(doc):
+    set_narrow_margins(doc)
     doc.add_heading("FRIENDLY FORCE INFORMATION REQUIREMENTS (FFIR)", level=1)
-    ffir_table = doc.add_table(rows=1, cols=3)
-    ffir_table.style = 'Table Grid'
-    for i, h in enumerate(["FFIR", "REQUIREMENT", "DECISION POINT"]):
-        ffir_table.rows[0].cells[i].text = h
-        for p in ffir_table.rows[0].cells[i].paragraphs:
-            for r in p.runs:
-                r.bold = True
-                r.font.size = Pt(9)
-        set_cell_shading(ffir_table.rows[0].cells[i], "E2EFDA")
-
-    ffirs = [
-        ("FFIR 1", "Loss of comms with any advisory team > 30 min", "Initiate PR procedures"),
-        ("FFIR 2", "U.S. KIA/WIA/MIA", "MEDEVAC/PR; notify higher"),
-        ("FFIR 3", f"HNSF readiness below 70% (current: {state.hnsf_readiness}%)", "Reassess advisory priorities"),
-        ("FFIR 4", "HNSF disloyalty or refusal to operate", "Reassess partner vetting"),
-        ("FFIR 5", "Corridor physical disruption", "Initiate rapid repair"),
-        ("FFIR 6", "ROE violation or unauthorized use of force", "Initiate investigation"),
-    ]
-    for f in ffirs:
-        row = ffir_table.add_row()
-        for i, val in enumerate(f):
-            row.cells[i].text = val
-            for p in row.cells[i].paragraphs:
-                for r in p.runs:
-                    r.font.size = Pt(9)
+    table = add_header_table(doc, ["FFIR", "REQUIREMENT", "DECISION POINT"], 9, _GREEN)
+    fill_cells(table.add_row().cells, slot_values(3), 9)
+
+_CCIR_OPENING = BodyTemplate(_ccir_opening)
+_CCIR_CLOSING = BodyTemplate(_ccir_closing)
+_CCIR_PIR_TABLE = TableTemplate(_ccir_pir_table)
+_CCIR_FFIR_TABLE = TableTemplate(_ccir_ffir_table)
+
+_CCIR_PHASE_PIRS = {
+    1: (
+        ("PIR 1", "SLM intentions/timeline for corridor attacks", "Adjust CSG posture"),
+        ("PIR 2", "SLM OOB, cell structure, leadership", "Prioritize SOTF-C ops"),
+        ("PIR 3", "Cross-border logistics routes/methods", "Adjust SOTF-B interdiction"),
+        ("PIR 4", "Popular support levels (Grove Laborers/Scrub Folk)", "Shape MISO strategy"),
+        ("PIR 5", "SLM advanced weapons (MANPADS, UAS)", "Adjust force protection"),
+        ("PIR 6", "SLM/sponsor cyber capabilities", "Elevate DCO posture"),
+    ),
+    2: (
+        ("PIR 1", "SLM adaptation to corridor security measures", "Adjust CSG TTPs"),
+        ("PIR 2", "SLM OOB changes and leadership movements", "Sequence clearing ops"),
+        ("PIR 3", "Cross-border logistics; effectiveness of interdiction", "Adjust border ops"),
+        ("PIR 4", "Population response to MISO and CA programs", "Redirect MISO/CA"),
+        ("PIR 5", "SLM advanced weapons acquisition", "Adjust force protection"),
+        ("PIR 6", "SLM cyber targeting of HNSF C2 systems", "Harden networks"),
+    ),
+    3: (
+        ("PIR 1", "SLM intentions to escalate or negotiate", "Inform CDR decision on operational tempo"),
+        ("PIR 2", "SLM remaining capability and cohesion", "Prioritize remaining clearing ops"),
+        ("PIR 3", "Foreign sponsor commitment level", "Inform diplomatic approach"),
+        ("PIR 4", "Population confidence in GoS reforms", "Advise GoS on reform pace"),
+        ("PIR 5", "SLM IED/sabotage residual capability", "Maintain corridor security"),
+        ("PIR 6", "SLM information ops effectiveness", "Counter remaining propaganda"),
+    ),
+    4: (
+        ("PIR 1", "SLM reconstitution potential", "Determine residual CT requirement"),
+        ("PIR 2", "HNSF sustainability without U.S. support", "Determine transition timeline"),
+        ("PIR 3", "Foreign sponsor future intentions", "Inform post-transition posture"),
+        ("PIR 4", "Population confidence trajectory", "Advise GoS on long-term stability"),
+        ("PIR 5", "Residual SLM cells and spoiler potential", "Maintain awareness"),
+        ("PIR 6", "GoS governance reform follow-through", "Shape final advisory messaging"),
+    ),
+}
 
-    doc.add_heading("EEFI", level=1)
-    eefis = ["SOF team locations/patterns", "ISR capabilities/gaps", "Intel sharing arrangements",
-             "CUAS capabilities", "MEDEVAC/PR procedures", "Comms architecture", "HNSF op timelines"]
-    for i, e in enumerate(eefis, 1):
-        add_para(doc, f"EEFI {i}: {e}", indent=1, space_after=2)
+# FFIR rows; requirements are format strings over the day's state
+_CCIR_FFIRS = (
+    ("FFIR 1", "Loss of comms with any advisory team > 30 min", "Initiate PR procedures"),
+    ("FFIR 2", "U.S. KIA/WIA/MIA", "MEDEVAC/PR; notify higher"),
+    ("FFIR 3", "HNSF readiness below 70% (current: {hnsf_readiness}%)", "Reassess advisory priorities"),
+    ("FFIR 4", "HNSF disloyalty or refusal to operate", "Reassess partner vetting"),
+    ("FFIR 5", "Corridor physical disruption", "Initiate rapid repair"),
+    ("FFIR 6", "ROE violation or unauthorized use of force", "Initiate investigation"),
+)
 
-    add_para(doc, "")
-    add_para(doc, f"Next CCIR review: {mil_dtg(state.date + timedelta(days=CCIR_INTERVAL))}", bold=True)
-    add_para(doc, "J.R. MACKENZIE, MG, USA — Commander, JTF-GG")
+def generate_ccir(state, output_dir, ccir_num):
+    doc = scratch_document("CCIR")
+
+    bindings = dict(
+        state.bindings,
+        CCIR_NUM=f"{ccir_num:03d}",
+        NEXT_REVIEW_DTG=mil_dtg(state.date + timedelta(days=CCIR_INTERVAL)),
+    )
+    _CCIR_OPENING.render(doc, bindings)
+    # PIRs evolve by phase
+    _CCIR_PIR_TABLE.render(doc, ((0, pir_data) for pir_data in _CCIR_PHASE_PIRS[state.phase]))
+
+    _CCIR_FFIR_TABLE.render(doc, (
+        (0, (ffir, requirement.format(hnsf_readiness=state.hnsf_readiness), decision))
+        for ffir, requirement, decision in _CCIR_FFIRS
+    ))
+
+    _CCIR_CLOSING.render(doc, bindings)
 
     add_classification_header_footer(doc)
-    fname = f"CCIR_{ccir_num:03d}_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"CCIR_{ccir_num:03d}_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
 
 
 # ------- PIR (Periodic) -------
 
-def generate_pir(state, output_dir, pir_num):
-    doc = Document()
-    set_narrow_margins(doc)
-
+def _pir_opening(doc):
     add_heading_block(doc, [
         "UNCLASSIFIED",
         "",
         "JTF-GROVE GUARDIAN",
-        f"PRIORITY INTELLIGENCE REQUIREMENTS UPDATE {pir_num:03d}",
-        f"DTG: {state.dtg} | DAY {state.day+1:03d} | PHASE {state.phase_label}",
+        "PRIORITY INTELLIGENCE REQUIREMENTS UPDATE {{PIR_NUM}}",
+        "DTG: {{DTG}} | DAY {{DAY}} | PHASE {{PHASE_LABEL}}",
     ])
 
-    # Detailed PIRs with indicators - evolve by phase
-    pir_configs = {
-        1: [
-            ("PIR 1: SLM Corridor Attack Intentions",
-             ["Increased comms along corridor", "Personnel/equipment movement toward infrastructure", "IED material pre-positioning", "Recon of CSG patrols"],
-             "SIGINT, HUMINT (tip-line), UAS ISR (SHADOW)", "Continuous; 24hr cycle"),
-            ("PIR 2: SLM Order of Battle",
-             ["New cell identification", "Strength/org changes", "Training activities", "Leadership movement", "Recruitment in company towns"],
-             "HUMINT (informants, defectors), SIGINT, UAS ISR, OSINT", "72hr update; immediate for leadership"),
-            ("PIR 3: Cross-Border Logistics",
-             ["Boat movement along coast", "Vehicle/pack movement at border", "New cache sites", "Financial transactions", "New weapons in SLM inventory"],
-             "SIGINT, GEOINT, UAS ISR, HUMINT (border), liaison intel", "72hr prep; immediate for active ops"),
-        ],
-        2: [
-            ("PIR 1: SLM Tactical Adaptation",
-             ["Changes to attack TTPs", "Shift to nighttime ops", "Use of new IED types", "Counter-ISR measures", "Targeting of HNSF leadership"],
-             "SIGINT, HUMINT, UAS ISR, TECHINT (recovered IEDs)", "Continuous; 24hr cycle"),
-            ("PIR 2: SLM Leadership and Cohesion",
-             ["Leadership disputes per SIGINT", "Cell fragmentation", "Defections/amnesty surrenders", "Changes in SLM messaging tone"],
-             "SIGINT, HUMINT (defectors), OSINT (social media)", "48hr update"),
-            ("PIR 3: Interdiction Effectiveness",
-             ["Reduction in border crossings", "SLM supply shortages", "Foreign sponsor response to interdiction", "New smuggling routes"],
-             "SIGINT, HUMINT, GEOINT, UAS ISR, liaison intel", "Weekly assessment"),
-        ],
-        3: [
-            ("PIR 1: SLM Escalation vs Negotiation Intent",
-             ["SLM leadership communications re: ceasefire", "Escalation of attacks as desperation", "Outreach to intermediaries", "Foreign sponsor guidance to SLM"],
-             "SIGINT, HUMINT, diplomatic channels", "Immediate; 24hr cycle"),
-            ("PIR 2: SLM Remaining Capability",
-             ["Functional cells remaining", "Weapons/ammo stockpile status", "Recruit pipeline", "Morale indicators"],
-             "All sources; defector debriefs critical", "48hr update"),
-            ("PIR 3: Population Sentiment Trajectory",
-             [f"Tip-line volume (current: ~{state.tip_line_calls}/day)", f"Amnesty rate (current: {state.amnesty_surrenders} total)", "GoS program participation", "Social media sentiment"],
-             "HUMINT (CA), OSINT, polling", "Weekly"),
-        ],
-        4: [
-            ("PIR 1: SLM Reconstitution Potential",
-             ["Remaining leadership at large", "Foreign sponsor willingness to re-arm", "Recruitment potential", "Residual safe havens"],
-             "All sources", "Weekly assessment"),
-            ("PIR 2: HNSF Sustainability",
-             [f"HNSF independent capability (current: {state.hnsf_readiness}%)", "Leadership quality", "Logistics self-sufficiency", "Intel collection capacity"],
-             "Advisory team assessments, HNSF reporting", "Weekly"),
-            ("PIR 3: GoS Reform Follow-Through",
-             ["Land reform implementation", "Labor law enforcement", "GoS spending on company town services", "Orchard Baron cooperation"],
-             "CA teams, Embassy reporting, OSINT", "Bi-weekly"),
-        ],
-    }
-
-    for title, indicators, collection, ltiov in pir_configs.get(state.phase, pir_configs[1]):
+def _pir_body(doc, phase):
+    for title, indicators, collection, ltiov in _PIR_CONFIGS[phase]:
         doc.add_heading(title, level=2)
         add_para(doc, "Indicators:", bold=True)
-        for ind in indicators:
-            add_para(doc, f"- {ind}", indent=1, space_after=2)
+        add_paras(doc, (f"- {ind}" for ind in indicators), indent=1, space_after=2)
         add_para(doc, f"Collection: {collection}")
         add_para(doc, f"LTIOV: {ltiov}")
         add_para(doc, "")
 
-    add_para(doc, f"Next PIR review: {mil_dtg(state.date + timedelta(days=PIR_INTERVAL))}", bold=True)
+# Detailed PIRs with indicators - evolve by phase. Indicators may carry
+# {{SLOT}} placeholders for the day's bindings.
+_PIR_CONFIGS = {
+    1: (
+        ("PIR 1: SLM Corridor Attack Intentions",
+         ("Increased comms along corridor", "Personnel/equipment movement toward infrastructure", "IED material pre-positioning", "Recon of CSG patrols"),
+         "SIGINT, HUMINT (tip-line), UAS ISR (SHADOW)", "Continuous; 24hr cycle"),
+        ("PIR 2: SLM Order of Battle",
+         ("New cell identification", "Strength/org changes", "Training activities", "Leadership movement", "Recruitment in company towns"),
+         "HUMINT (informants, defectors), SIGINT, UAS ISR, OSINT", "72hr update; immediate for leadership"),
+        ("PIR 3: Cross-Border Logistics",
+         ("Boat movement along coast", "Vehicle/pack movement at border", "New cache sites", "Financial transactions", "New weapons in SLM inventory"),
+         "SIGINT, GEOINT, UAS ISR, HUMINT (border), liaison intel", "72hr prep; immediate for active ops"),
+    ),
+    2: (
+        ("PIR 1: SLM Tactical Adaptation",
+         ("Changes to attack TTPs", "Shift to nighttime ops", "Use of new IED types", "Counter-ISR measures", "Targeting of HNSF leadership"),
+         "SIGINT, HUMINT, UAS ISR, TECHINT (recovered IEDs)", "Continuous; 24hr cycle"),
+        ("PIR 2: SLM Leadership and Cohesion",
+         ("Leadership disputes per SIGINT", "Cell fragmentation", "Defections/amnesty surrenders", "Changes in SLM messaging tone"),
+         "SIGINT, HUMINT (defectors), OSINT (social media)", "48hr update"),
+        ("PIR 3: Interdiction Effectiveness",
+         ("Reduction in border crossings", "SLM supply shortages", "Foreign sponsor response to interdiction", "New smuggling routes"),
+         "SIGINT, HUMINT, GEOINT, UAS ISR, liaison intel", "Weekly assessment"),
+    ),
+    3: (
+        ("PIR 1: SLM Escalation vs Negotiation Intent",
+         ("SLM leadership communications re: ceasefire", "Escalation of attacks as desperation", "Outreach to intermediaries", "Foreign sponsor guidance to SLM"),
+         "SIGINT, HUMINT, diplomatic channels", "Immediate; 24hr cycle"),
+        ("PIR 2: SLM Remaining Capability",
+         ("Functional cells remaining", "Weapons/ammo stockpile status", "Recruit pipeline", "Morale indicators"),
+         "All sources; defector debriefs critical", "48hr update"),
+        ("PIR 3: Population Sentiment Trajectory",
+         ("Tip-line volume (current: ~{{TIP_LINE_CALLS}}/day)", "Amnesty rate (current: {{AMNESTY_SURRENDERS}} total)", "GoS program participation", "Social media sentiment"),
+         "HUMINT (CA), OSINT, polling", "Weekly"),
+    ),
+    4: (
+        ("PIR 1: SLM Reconstitution Potential",
+         ("Remaining leadership at large", "Foreign sponsor willingness to re-arm", "Recruitment potential", "Residual safe havens"),
+         "All sources", "Weekly assessment"),
+        ("PIR 2: HNSF Sustainability",
+         ("HNSF independent capability (current: {{HNSF_READINESS}}%)", "Leadership quality", "Logistics self-sufficiency", "Intel collection capacity"),
+         "Advisory team assessments, HNSF reporting", "Weekly"),
+        ("PIR 3: GoS Reform Follow-Through",
+         ("Land reform implementation", "Labor law enforcement", "GoS spending on company town services", "Orchard Baron cooperation"),
+         "CA teams, Embassy reporting, OSINT", "Bi-weekly"),
+    ),
+}
+
+
+def _pir_closing(doc):
+    add_para(doc, "Next PIR review: {{NEXT_REVIEW_DTG}}", bold=True)
     add_para(doc, "S.K. NORTON, COL, MI — JTF J-2")
 
+_PIR_OPENING = BodyTemplate(_pir_opening)
+_PIR_BODIES = {phase: BodyTemplate(functools.partial(_pir_body, phase=phase)) for phase in _PIR_CONFIGS}
+_PIR_CLOSING = BodyTemplate(_pir_closing)
+
+def generate_pir(state, output_dir, pir_num):
+    doc = scratch_document("PIR")
+
+    bindings = dict(
+        state.bindings,
+        PIR_NUM=f"{pir_num:03d}",
+        NEXT_REVIEW_DTG=mil_dtg(state.date + timedelta(days=PIR_INTERVAL)),
+    )
+    _PIR_OPENING.render(doc, bindings)
+
+    _PIR_BODIES[state.phase].render(doc, bindings)
+    _PIR_CLOSING.render(doc, bindings)
+
     add_classification_header_footer(doc)
-    fname = f"PIR_{pir_num:03d}_Day_{state.day+1:03d}.docx"
-    path = os.path.join(output_dir, fname)
-    doc.save(path)
-    return path
+    fname = f"PIR_{pir_num:03d}_Day_{state.day_str}.docx"
+    path = output_dir + fname
+    return doc, path
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+class _ZipPartWriter:
+    """Zip writer with the interface PackageWriter expects, at a chosen level."""
+
+    def __init__(self, pkg_file, compresslevel):
+        if compresslevel:
+            self._zipf = zipfile.ZipFile(pkg_file, "w", zipfile.ZIP_DEFLATED,
+                                         compresslevel=compresslevel)
+        else:
+            self._zipf = zipfile.ZipFile(pkg_file, "w", zipfile.ZIP_STORED)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+# Template parts no generator may modify after new_document(); save_docx
+# writes them from a cached blob, so edits to them would be lost
+_FROZEN_PARTS = frozenset((
+    "/word/styles.xml", "/word/stylesWithEffects.xml", "/word/theme/theme1.xml",
+    "/word/fontTable.xml", "/word/webSettings.xml",
+))
+
+@functools.lru_cache(maxsize=None)
+def _template_part_blobs():
+    """Return {partname: blob} for the read-only parts in _FROZEN_PARTS.
+
+    These come out of every document exactly as new_document() left them,
+    so they are serialized once. Every other part (the document body,
+    settings, numbering, docProps, headers and footers) is serialized on
+    each save, so changes a generator makes to it are kept.
+    """
+    doc = new_document()
+    return {part.partname: part.blob for part in doc.part.package.parts
+            if part.partname in _FROZEN_PARTS}
+
+# save_docx drives PackageWriter's private helpers; without them (a
+# python-docx outside the tested range) it falls back to Document.save()
+_HAS_PKGWRITER_HOOKS = all(hasattr(PackageWriter, name) for name in
+                           ("_write_content_types_stream", "_write_pkg_rels"))
+
+def save_docx(doc, pkg_file, compresslevel=DOCX_COMPRESSLEVEL):
+    """Save doc to a path or file object, like Document.save() but with a
+    configurable deflate level."""
+    if not _HAS_PKGWRITER_HOOKS:
+        doc.save(pkg_file)
+        return
+    # Same steps as OpcPackage.save() / PackageWriter.write()
+    package = doc.part.package
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+    writer = _ZipPartWriter(pkg_file, compresslevel)
+    PackageWriter._write_content_types_stream(writer, parts)
+    PackageWriter._write_pkg_rels(writer, package.rels)
+    template_blobs = _template_part_blobs()
+    for part in parts:
+        blob = template_blobs.get(part.partname)
+        writer.write(part.partname, part.blob if blob is None else blob)
+        if len(part.rels):
+            writer.write(part.partname.rels_uri, part.rels.xml)
+    writer.close()
+
+def _write_bytes(path, data):
+    """Write a finished file with one open() and, normally, one write().
+
+    The data goes to a temporary name beside `path` and is renamed into
+    place, so a reader never sees a partly written file.
+    """
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+class DocumentWriter:
+    """Writes serialized documents on a pool of background threads.
+
+    File writes release the GIL, so the next day can be built while
+    earlier ones are still being written. Documents are handed over a day
+    at a time, one pool task per batch; a batch can also be packed into a
+    single bundle .zip instead of one file per document.
+    """
+
+    def __init__(self, max_workers=None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count())
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.drain()
+        self._pool.shutdown()
+
+    def write_batch(self, files, bundle=None):
+        """Queue a batch of serialized (path, data) pairs to be written.
+
+        If `bundle` is given, the documents are stored in that zip file
+        under their paths instead of being written individually.
+        """
+        self._reap()
+        self._pending.append(self._pool.submit(self._write_batch, files, bundle))
+
+    def drain(self):
+        """Block until every queued write has finished."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    @staticmethod
+    def _write_batch(files, bundle):
+        if bundle is None:
+            for path, data in files:
+                _write_bytes(path, data)
+            return
+        # .docx members are already deflated, so the bundle just stores them.
+        # The zip's many small header writes are coalesced by a large buffer.
+        tmp = bundle + ".tmp"
+        with open(tmp, "wb", buffering=BUNDLE_BUFFER_SIZE) as f:
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as bundle_zip:
+                for path, data in files:
+                    bundle_zip.writestr(path, data)
+        os.replace(tmp, bundle)
+
+    def _reap(self):
+        # Drop finished writes (surfacing any error) so their bytes can be freed
+        still_pending = []
+        for future in self._pending:
+            if future.done():
+                future.result()
+            else:
+                still_pending.append(future)
+        self._pending = still_pending
 
 
 # ============================================================================
 # MAIN ORCHESTRATOR
 # ============================================================================
 
-def run(num_days, output_root):
-    """Generate all documents for the specified number of operational days."""
-
-    # Create output directories
-    dirs = {
-        "OPORD": os.path.join(output_root, "OPORD"),
-        "FRAGO": os.path.join(output_root, "FRAGO"),
-        "ATO":   os.path.join(output_root, "ATO"),
-        "ROE":   os.path.join(output_root, "ROE"),
-        "ACO":   os.path.join(output_root, "ACO"),
-        "CCIR":  os.path.join(output_root, "CCIR"),
-        "PIR":   os.path.join(output_root, "PIR"),
-        "JIPTL": os.path.join(output_root, "JIPTL"),
-    }
-    for d in dirs.values():
-        os.makedirs(d, exist_ok=True)
-
-    frago_counter = 0
-    ccir_counter = 0
-    pir_counter = 0
-    roe_version = 0
-    last_phase = 0
+def issue_number(day, interval):
+    """Sequence number of a document issued every `interval` days plus at
+    each phase transition, as of `day` (counting from D-Day)."""
+    extra = sum(1 for t in _PHASE_TRANSITION_DAYS if t <= day and t % interval)
+    return day // interval + 1 + extra
+
+def generate_day(day, dirs):
+    """Build every document due on `day`.
+
+    Returns the day's state and a list of (doc, path) pairs, unsaved.
+    The documents are this thread's scratch documents, so save them before
+    the next call. Document numbers are derived from the day itself, so
+    days can be generated in any order or in separate processes.
+    """
+    state = daily_state(day)
+    phase_changed = is_phase_transition(day)
+    docs = []
+
+    # OPORD — phase transitions only
+    if phase_changed:
+        docs.append(generate_opord(state, dirs["OPORD"]))
+
+    # ROE — phase transitions
+    if phase_changed:
+        roe_version = sum(1 for t in _PHASE_TRANSITION_DAYS if t <= day)
+        docs.append(generate_roe(state, dirs["ROE"], roe_version))
+
+    # FRAGO — daily
+    docs.append(generate_frago(state, dirs["FRAGO"], day + 1))
+
+    # ATO — daily
+    docs.append(generate_ato(state, dirs["ATO"]))
+
+    # ACO — daily
+    docs.append(generate_aco(state, dirs["ACO"]))
+
+    # JIPTL — daily
+    docs.append(generate_jiptl(state, dirs["JIPTL"]))
+
+    # CCIR — every N days + phase transitions
+    if day % CCIR_INTERVAL == 0 or phase_changed:
+        docs.append(generate_ccir(state, dirs["CCIR"], issue_number(day, CCIR_INTERVAL)))
+
+    # PIR — every N days + phase transitions
+    if day % PIR_INTERVAL == 0 or phase_changed:
+        docs.append(generate_pir(state, dirs["PIR"], issue_number(day, PIR_INTERVAL)))
+
+    return state, docs
+
+def _render_day(day, dirs, compresslevel):
+    """Generate a day and serialize its documents to bytes."""
+    state, docs = generate_day(day, dirs)
+    rendered = []
+    for doc, path in docs:
+        buf = io.BytesIO()
+        save_docx(doc, buf, compresslevel)
+        rendered.append((path, buf.getvalue()))
+    return state, rendered
+
+def run(num_days, output_root, workers=None, compresslevel=DOCX_COMPRESSLEVEL, bundle=False):
+    """Generate all documents for the specified number of operational days.
+
+    With more than one worker, days are spread across a process pool and
+    the main process only writes the finished files. `compresslevel` is
+    the .docx deflate level (0 stores uncompressed). With `bundle`, each
+    day's documents go into a single Day_NNN.zip under output_root, laid
+    out in the same per-type folders. Every document path is listed in
+    MANIFEST_NAME under output_root once the run finishes.
+    """
+    # Workers beyond the number of day chunks would sit idle
+    workers = min(workers or os.cpu_count(), -(-num_days // DAYS_PER_TASK))
+
+    doc_types = ["OPORD", "FRAGO", "ATO", "ROE", "ACO", "CCIR", "PIR", "JIPTL"]
+    if bundle:
+        # Document paths are relative to the root of each day's bundle
+        dirs = {name: name + "/" for name in doc_types}
+        os.makedirs(output_root, exist_ok=True)
+    else:
+        # Create output directories
+        dirs = {name: os.path.join(output_root, name, "") for name in doc_types}
+        for d in dirs.values():
+            os.makedirs(d, exist_ok=True)
+    # Generators build paths as dirs[type] + filename, so each ends in a separator
+
+    root_prefix = os.path.join(output_root, "")
+
+    def bundle_path(day):
+        return root_prefix + f"Day_{day+1:03d}.zip" if bundle else None
+
+    manifest = []
+    doc_counts = defaultdict(int)
+
+    def record(day, paths):
+        for path in paths:
+            # Every file name starts with its document type
+            doc_counts[os.path.basename(path).partition("_")[0]] += 1
+        if bundle:
+            member_prefix = f"Day_{day+1:03d}.zip/"
+            manifest.extend(member_prefix + path for path in paths)
+        else:
+            manifest.extend(path[len(root_prefix):] for path in paths)
+
     total_docs = 0
 
     print(f"\n{'='*60}")
@@ -1185,67 +1921,39 @@ def run(num_days, output_root):
     print(f"Output: {output_root}")
     print(f"{'='*60}\n")
 
-    for day in range(num_days):
-        state = DailyState(day)
-        current_phase = state.phase
-        phase_changed = (current_phase != last_phase)
+    def report(state, day_docs):
+        print(f"  Day {state.day_str} (D+{state.day}) | Phase {state.phase_label}: {state.phase_name} | "
+              f"SLM: {state.slm_strength} | HNSF: {state.hnsf_readiness}% | {day_docs} docs")
 
-        print(f"  Day {day+1:03d} (D+{day}) | Phase {state.phase_label}: {state.phase_name} | "
-              f"SLM: {state.slm_strength} | HNSF: {state.hnsf_readiness}%", end="")
-
-        day_docs = 0
-
-        # OPORD — phase transitions only
-        if phase_changed:
-            generate_opord(state, dirs["OPORD"])
-            day_docs += 1
-
-        # ROE — phase transitions
-        if phase_changed:
-            roe_version += 1
-            generate_roe(state, dirs["ROE"], roe_version)
-            day_docs += 1
-
-        # FRAGO — daily
-        frago_counter += 1
-        generate_frago(state, dirs["FRAGO"], frago_counter)
-        day_docs += 1
-
-        # ATO — daily
-        generate_ato(state, dirs["ATO"])
-        day_docs += 1
-
-        # ACO — daily
-        generate_aco(state, dirs["ACO"])
-        day_docs += 1
-
-        # JIPTL — daily
-        generate_jiptl(state, dirs["JIPTL"])
-        day_docs += 1
-
-        # CCIR — every N days + phase transitions
-        if day % CCIR_INTERVAL == 0 or phase_changed:
-            ccir_counter += 1
-            generate_ccir(state, dirs["CCIR"], ccir_counter)
-            day_docs += 1
-
-        # PIR — every N days + phase transitions
-        if day % PIR_INTERVAL == 0 or phase_changed:
-            pir_counter += 1
-            generate_pir(state, dirs["PIR"], pir_counter)
-            day_docs += 1
-
-        total_docs += day_docs
-        last_phase = current_phase
-        print(f" | {day_docs} docs")
+    render = functools.partial(_render_day, dirs=dirs, compresslevel=compresslevel)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if pool:
+            # Submitting forks the workers, so do it before the writer starts its threads
+            days = pool.map(render, range(num_days), chunksize=DAYS_PER_TASK)
+        else:
+            days = map(render, range(num_days))
+        with DocumentWriter() as writer:
+            for state, rendered in days:
+                writer.write_batch(rendered, bundle_path(state.day))
+                record(state.day, [path for path, _ in rendered])
+                total_docs += len(rendered)
+                report(state, len(rendered))
+    finally:
+        if pool:
+            pool.shutdown()
+
+    _write_bytes(root_prefix + MANIFEST_NAME, "".join(path + "\n" for path in manifest).encode())
 
     print(f"\n{'='*60}")
     print(f"COMPLETE: {total_docs} documents generated across {num_days} days.")
     print(f"{'='*60}")
     print(f"\nOutput structure:")
-    for name, path in dirs.items():
-        count = len([f for f in os.listdir(path) if f.endswith('.docx')])
-        print(f"  {name:8s}/ — {count} documents")
+    if bundle:
+        print(f"  Day_NNN.zip — {num_days} daily bundles ({', '.join(doc_types)})")
+    else:
+        for name in dirs:
+            print(f"  {name:8s}/ — {doc_counts[name]} documents")
     print()
 
 
@@ -1257,6 +1965,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="OPERATION GROVE GUARDIAN Synthetic Data Generator")
     parser.add_argument("--days", type=int, default=8, help="Number of operational days to generate (default: 8)")
     parser.add_argument("--output", type=str, default="./OGG_Output", help="Output root directory (default: ./OGG_Output)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes for day generation (default: CPU count)")
+    parser.add_argument("--compress-level", type=int, default=DOCX_COMPRESSLEVEL, choices=range(10), metavar="0-9",
+                        help=f".docx deflate level, 0 = uncompressed (default: {DOCX_COMPRESSLEVEL})")
+    parser.add_argument("--bundle", action="store_true", help="Write one Day_NNN.zip per day instead of individual .docx files")
     args = parser.parse_args()
 
-    run(args.days, args.output)
+    run(args.days, args.output, args.workers, args.compress_level, args.bundle)